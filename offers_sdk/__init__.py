@@ -1,6 +1,7 @@
 """Offers SDK package."""
 
-from .client import Client
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import (
     InvalidAPIRequestException,
     InvalidClientTypeException,
@@ -11,6 +12,9 @@ from .exceptions import (
 from .models.product import Product
 from .models.offer import Offer
 
+if TYPE_CHECKING:
+    from .client import Client
+
 __version__ = "0.1.0"
 
 __all__ = [
@@ -23,3 +27,13 @@ __all__ = [
     "AuthException",
     "ValidationException",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Client is imported lazily so that `import offers_sdk` (and the CLI) stays cheap.
+    if name == "Client":
+        from .client import Client
+
+        globals()["Client"] = Client
+        return Client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
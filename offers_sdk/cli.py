@@ -10,23 +10,23 @@ from the command line. It supports both single and batch operations.
 Structure:
 
 1. Helpers
-   - `_parse_products(file_path: str) -> List[Product]`
-     Parses a JSON file into a list of Product objects.
+   - `_parse_products(file_path: str) -> Iterator[Product]`
+     Streams Product objects from a JSON file.
 
-   - `_parse_ids(file_path: str) -> List[UUID]`
-     Parses a JSON file into a list of UUIDs.
+   - `_parse_ids(file_path: str) -> Iterator[UUID]`
+     Streams UUIDs from a JSON file.
 
 2. Commands
    - `register(client: Client, id: str, name: str, description: str)`
      Register a single product/offer.
 
-   - `register_batch(client: Client, file_path: str)`
+   - `register_batch(client: Client, file_path: str, concurrency: int)`
      Register multiple products/offers from a JSON file concurrently.
 
    - `get_offers(client: Client, id: str)`
      Fetch offers for a single product/offer ID.
 
-   - `get_offers_batch(client: Client, file_path: str)`
+   - `get_offers_batch(client: Client, file_path: str, concurrency: int)`
      Fetch offers for multiple product/offer IDs from a JSON file concurrently.
 
 3. CLI Entrypoint (`main()`)
@@ -56,89 +56,228 @@ Example usage:
 """
 
 import argparse
-import asyncio
-import json
-from typing import List
-from uuid import UUID
-
-from .client import Client
-from .models import Offer, Product
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+)
+from uuid import UUID, SafeUUID
+
+import ijson
+
+from . import __version__
+
+# Client and models pull in the HTTP stacks, so they are imported lazily inside
+# the commands. This keeps `--help`, `--version` and argument errors cheap.
+if TYPE_CHECKING:
+    from .client import Client
+    from .models import Offer, Product
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Default upper bound of in-flight requests of the batch commands.
+DEFAULT_CONCURRENCY = 32
 
 
 # ----------------------------------------------------------------------
 # Helpers
 # ----------------------------------------------------------------------
-def _parse_products(file_path: str) -> List[Product]:
-    """Parse a JSON file into a list of Product objects."""
-    with open(file_path, "r", encoding="utf-8") as f:
-        products_json = json.load(f)
-
-    if not isinstance(products_json, list):
-        raise ValueError("JSON file must contain a list of offers")
-
-    return [
-        Product(
-            id=UUID(data["id"]),
+def _fast_uuid(
+    value: str,
+    _UUID=UUID,
+    _new=object.__new__,
+    _set=object.__setattr__,
+    _unknown=SafeUUID.unknown,
+) -> UUID:
+    """
+    Build a UUID from its string form.
+
+    Strings of 32 ASCII letters/digits (hyphens ignored) are validated by
+    `int(..., 16)` alone and skip `UUID.__init__` and its argument checks; the
+    instance is filled the same way `UUID.__init__` does it internally. Anything
+    else goes through `UUID(str)`, which accepts the remaining forms (braces,
+    `urn:uuid:`) or raises ValueError. The default arguments only bind globals
+    to locals for speed.
+
+    Raises:
+        ValueError: If the value is not a valid UUID.
+    """
+    hex_str = value.replace("-", "")
+    if len(hex_str) == 32 and hex_str.isascii() and hex_str.isalnum():
+        try:
+            uuid_int = int(hex_str, 16)
+        except ValueError:
+            # Right shape but non-hex letters: no other UUID form can match.
+            raise ValueError("badly formed hexadecimal UUID string") from None
+        uuid = _new(_UUID)
+        _set(uuid, "int", uuid_int)
+        _set(uuid, "is_safe", _unknown)
+        return uuid
+    return _UUID(value)
+
+
+def _iter_json_array(file_path: str, error_message: str) -> Iterator[Any]:
+    """
+    Stream the items of a top-level JSON array from a file.
+
+    Items are parsed incrementally, so the whole file is never held in memory.
+
+    Raises:
+        ValueError: If the file is not a JSON array or is malformed (e.g. empty or
+            truncated), like `json.load` would.
+    """
+    with open(file_path, "rb") as f:
+        events = ijson.parse(f)
+        try:
+            _, event, _ = next(events, ("", None, None))
+            if event != "start_array":
+                raise ValueError(error_message)
+            yield from ijson.items(events, "item")
+        except ijson.JSONError as e:
+            raise ValueError(error_message) from e
+
+
+def _parse_products(file_path: str) -> Iterator["Product"]:
+    """Lazily parse a JSON file into Product objects."""
+    from .models import Product
+
+    for data in _iter_json_array(file_path, "JSON file must contain a list of offers"):
+        yield Product(
+            id=_fast_uuid(data["id"]),
             name=data["name"],
             description=data["description"],
         )
-        for data in products_json
-    ]
 
 
-def _parse_ids(file_path: str) -> List[UUID]:
-    """Parse a JSON file into a list of UUIDs."""
-    with open(file_path, "r", encoding="utf-8") as f:
-        ids_json = json.load(f)
+def _parse_ids(file_path: str) -> Iterator[UUID]:
+    """Lazily parse a JSON file into UUIDs."""
+    for id in _iter_json_array(file_path, "JSON file must contain a list of ids"):
+        yield _fast_uuid(id)
+
+
+async def _iter_bounded(
+    items: Iterable[T], call: Callable[[T], Awaitable[R]], concurrency: int
+) -> AsyncIterator[Tuple[T, R]]:
+    """
+    Run `call` for every item with at most `concurrency` calls in flight and
+    yield `(item, result)` pairs in completion order.
+
+    Items are pulled from the iterable only when a slot is free, so a streamed
+    input file is read at the pace the requests complete, and only the results
+    of in-flight calls are held in memory.
+    """
+    import asyncio
+
+    pending: Dict["asyncio.Task[R]", T] = {}
 
-    if not isinstance(ids_json, list):
-        raise ValueError("JSON file must contain a list of ids")
+    async def _completed() -> AsyncIterator[Tuple[T, R]]:
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            yield pending.pop(task), task.result()
 
-    return [UUID(id) for id in ids_json]
+    for item in items:
+        if len(pending) >= concurrency:
+            async for completed in _completed():
+                yield completed
+        pending[asyncio.create_task(call(item))] = item
+
+    while pending:
+        async for completed in _completed():
+            yield completed
+
+
+def _run(main: Coroutine[Any, Any, R]) -> R:
+    """Run a command's coroutine on uvloop if it is installed, else on asyncio."""
+    try:
+        import uvloop
+    except ImportError:
+        import asyncio
+
+        return asyncio.run(main)
+    return uvloop.run(main)
+
+
+def _positive_int(value: str) -> int:
+    """argparse type accepting only integers >= 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
 
 
 # ----------------------------------------------------------------------
 # Commands
 # ----------------------------------------------------------------------
-def register(client: Client, id: str, name: str, description: str):
+def register(client: "Client", id: str, name: str, description: str):
     """Register a single product/offer."""
-    product = Product(id=UUID(id), name=name, description=description)
-    asyncio.run(client.register_product(product))
+    from .models import Product
+
+    product = Product(id=_fast_uuid(id), name=name, description=description)
 
+    async def _register():
+        async with client:
+            await client.register_product(product)
 
-def register_batch(client: Client, file_path: str):
+    _run(_register())
+
+
+def register_batch(
+    client: "Client", file_path: str, concurrency: int = DEFAULT_CONCURRENCY
+):
     """Register multiple products from JSON file."""
-    products: List[Product] = _parse_products(file_path)
 
     async def _register_all():
-        tasks = [client.register_product(p) for p in products]
-        return await asyncio.gather(*tasks)
+        # All tasks share the client's connection pool, closed on exit.
+        async with client:
+            async for _ in _iter_bounded(
+                _parse_products(file_path), client.register_product, concurrency
+            ):
+                pass
 
-    return asyncio.run(_register_all())
+    _run(_register_all())
 
 
-def get_offers(client: Client, id: str):
+def get_offers(client: "Client", id: str):
     """Fetch offers for a given ID."""
-    offers: List[Offer] = asyncio.run(client.get_offers(UUID(id)))
+
+    async def _fetch():
+        async with client:
+            return await client.get_offers(_fast_uuid(id))
+
+    offers: List["Offer"] = _run(_fetch())
 
     for offer in offers:
         print(offer)
 
 
-def get_offers_batch(client: Client, file_path: str):
+def get_offers_batch(
+    client: "Client", file_path: str, concurrency: int = DEFAULT_CONCURRENCY
+):
     """Fetch offers for multiple IDs from JSON file."""
-    product_ids: List[UUID] = _parse_ids(file_path)
 
     async def _fetch_all():
-        tasks = [client.get_offers(pid) for pid in product_ids]
-        return await asyncio.gather(*tasks)
+        async with client:
+            # Offers of each product are printed as soon as they arrive.
+            async for product_id, offers in _iter_bounded(
+                _parse_ids(file_path), client.get_offers, concurrency
+            ):
+                lines = [f"For product {product_id}, following offers were obtained:"]
+                lines.extend(map(str, offers))
+                lines.append("")
+                sys.stdout.write("\n".join(lines))
 
-    # return asyncio.run(_fetch_all())
-    offers_for_products: List[List[Offer]] = asyncio.run(_fetch_all())
-    for product_id, offers in zip(product_ids, offers_for_products):
-        print(f"For product {product_id}, following offers were obtained:")
-        for offer in offers:
-            print(offer)
+    _run(_fetch_all())
 
 
 # ----------------------------------------------------------------------
@@ -150,6 +289,12 @@ def main():
         description="Command line interface for Offers SDK",
     )
 
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}",
+    )
+
     parser.add_argument(
         "--client-location",
         required=True,
@@ -185,6 +330,12 @@ def main():
         required=True,
         help="Path to JSON file containing products",
     )
+    register_batch_parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum number of concurrent requests (default: {DEFAULT_CONCURRENCY})",
+    )
 
     # get_offers
     get_offers_parser = subparsers.add_parser(
@@ -205,23 +356,36 @@ def main():
         required=True,
         help="Path to JSON file containing IDs",
     )
+    get_offers_batch_parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum number of concurrent requests (default: {DEFAULT_CONCURRENCY})",
+    )
 
+    # `--help`, `--version` and invalid arguments exit here, before any
+    # HTTP client library is imported.
     args = parser.parse_args()
+
+    from .client import Client
+
     client = Client.load_from_file(args.client_location)
 
     if args.command == "register":
         register(client, args.id, args.name, args.description)
 
     elif args.command == "register_batch":
-        register_batch(client, args.file)
+        register_batch(client, args.file, args.concurrency)
 
     elif args.command == "get_offers":
         get_offers(client, args.id)
 
     elif args.command == "get_offers_batch":
-        get_offers_batch(client, args.file)
+        get_offers_batch(client, args.file, args.concurrency)
 
-    client.save_to_file(args.client_location)
+    # Only a refreshed access token changes the stored state.
+    if client.has_unsaved_changes:
+        client.save_to_file(args.client_location)
 
 
 if __name__ == "__main__":
@@ -11,13 +11,17 @@ Raises custom exceptions for API errors and authentication issues.
 """
 
 import os
-import json
-from json import JSONDecodeError
+import time
+import asyncio
+import functools
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
 from uuid import UUID
 
+import msgspec
+import orjson
+
 from .exceptions import (
     InvalidAPIRequestException,
     InvalidClientTypeException,
@@ -26,8 +30,19 @@ from .exceptions import (
     ValidationException,
 )
 from .models import Offer, Product
-from .services import APIResponse
-from .services import IHttpClient, AioHttpClient, HttpxClient, RequestsClient
+from . import services
+from .services import APIResponse, IHttpClient, ResponseCache
+from .services.json_body import decode_json
+
+if TYPE_CHECKING:
+    from .models import OfferBatch
+
+
+@functools.lru_cache(maxsize=32)
+def _read_state(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # Keyed on the file's mtime and size as well, so a rewritten file is re-read.
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 class Client:
@@ -43,50 +58,72 @@ class Client:
     Attributes:
         AUTH: Endpoint for authentication
         PRODUCT_REGISTER: Endpoint to register a product
-        OFFERS: Endpoint to retrieve offers for a product
+        PRODUCTS: Endpoint prefix of products, offers of a product are at
+            `{PRODUCTS}/{product_id}/offers`
         ACCESS_TOKEN_TIMEOUT: Token validity period in minutes
-        HTTP_CLIENT_CLASSES: Supported HTTP client implementations
+        HTTP_CLIENT_CLASSES: Supported HTTP client implementations, mapped to
+            class names in `offers_sdk.services` (imported only when selected)
     """
 
     AUTH = "/api/v1/auth"
     PRODUCT_REGISTER = "/api/v1/products/register"
-    OFFERS = "/api/v1/products/{product_id}/offers"
+    PRODUCTS = "/api/v1/products"
     ACCESS_TOKEN_TIMEOUT: float = 5.0  # minutes
 
     HTTP_CLIENT_CLASSES = {
-        "requests": RequestsClient,
-        "aiohttp": AioHttpClient,
-        "httpx": HttpxClient,
+        "requests": "RequestsClient",
+        "aiohttp": "AioHttpClient",
+        "httpx": "HttpxClient",
     }
 
     def __init__(
         self,
         refresh_token: str,
         base_url: str = "https://python.exercise.applifting.cz",
-        http_client_type: str = "requests",
+        http_client_type: str = "aiohttp",
         logging: bool = False,
         log_dir: str = "logs",
+        cache: ResponseCache | None = None,
     ) -> None:
         self.base_url = base_url
         self.refresh_token = refresh_token
-        self.access_token: str = ""
-        self.token_expiry: datetime = datetime.min
+        # Setting `access_token` also sets `_auth_headers`, see the property.
+        self._access_token: str
+        self._auth_headers: Dict[str, str]
+        self.access_token = ""
+        # Setting `token_expiry` also sets `_token_deadline_ns`, see the property.
+        self._token_expiry: datetime
+        self._token_deadline_ns: int
+        self.token_expiry = datetime.min
         self.logging = logging
         self.log_dir = log_dir
+        # Log directory already created by `_log_request`, avoids a makedirs per request.
+        self._created_log_dir: str | None = None
         self.http_client_type: str = http_client_type
         self.http_client: IHttpClient
+        # Serializes token refreshes of concurrent coroutines, see `_get_auth_lock`.
+        self._auth_lock: asyncio.Lock | None = None
+        self._auth_lock_loop: asyncio.AbstractEventLoop | None = None
+
+        # Set when the state changed since it was loaded (new access token).
+        self._dirty = False
 
-        self._init_http_client(http_client_type)
+        # Caches `get_offers` responses when given (opt-in, see `clear_cache`).
+        self._init_http_client(http_client_type, cache)
 
-    def _init_http_client(self, http_client_type: str) -> None:
+    def _init_http_client(
+        self, http_client_type: str, cache: ResponseCache | None = None
+    ) -> None:
         """Initialize the HTTP client based on the provided type."""
-        http_client_class = self.HTTP_CLIENT_CLASSES.get(http_client_type)
-        if not http_client_class:
+        http_client_class_name = self.HTTP_CLIENT_CLASSES.get(http_client_type)
+        if not http_client_class_name:
             raise InvalidClientTypeException(
                 f"Unsupported HTTP client type: {http_client_type}\n"
                 f"Supported types: {list(self.HTTP_CLIENT_CLASSES.keys())}"
             )
-        self.http_client = http_client_class()
+        # Resolving the attribute imports only the selected backend module.
+        http_client_class = getattr(services, http_client_class_name)
+        self.http_client = http_client_class(cache=cache)
 
     def _log_request(
         self,
@@ -97,28 +134,32 @@ class Client:
         api_response: APIResponse,
     ) -> None:
         """Log API requests and responses to files in the specified log directory."""
-        os.makedirs(self.log_dir, exist_ok=True)
-        datetime_string = (
-            datetime.now()
-            .isoformat(timespec="milliseconds")
-            .replace("T", "-")
-            .replace(":", "")
-            .replace(".", "-")
-        )
+        if self._created_log_dir != self.log_dir:
+            os.makedirs(self.log_dir, exist_ok=True)
+            self._created_log_dir = self.log_dir
+        datetime_string = datetime.now().strftime("%Y-%m-%d-%H%M%S-%f")
         log_path = os.path.join(self.log_dir, f"{datetime_string}-{req_type}.log")
         with open(log_path, "w") as log_file:
-            log_file.write(f"URL: {url}\n")
-            log_file.write("Headers:\n")
-            log_file.write(f"{headers}\n")
-            log_file.write("Data:\n")
-            log_file.write(f"{data}\n")
-            log_file.write("API Response:\n")
-            log_file.write(f"{api_response}\n")
+            log_file.write(
+                f"URL: {url}\n"
+                "Headers:\n"
+                f"{headers}\n"
+                "Data:\n"
+                f"{data}\n"
+                "API Response:\n"
+                f"{api_response}\n"
+            )
 
     # -------------------------------------------------------------------------
     # Authentication
     # -------------------------------------------------------------------------
 
+    def _auth_request(self) -> tuple[str, dict, dict]:
+        """Build URL, headers and payload of the authentication request."""
+        url = f"{self.base_url}{self.AUTH}"
+        headers = {"accept": "application/json", "Bearer": self.refresh_token}
+        return url, headers, {}
+
     def retrieve_access_token(self) -> None:
         """
         Retrieve a new access token using the refresh token.
@@ -126,42 +167,97 @@ class Client:
         Raises:
             AuthException, InvalidAPIRequestException, APIException
         """
-        url = f"{self.base_url}{self.AUTH}"
-        headers = {"accept": "application/json", "Bearer": self.refresh_token}
-        data = {}
-
+        url, headers, data = self._auth_request()
         api_response = self.http_client.sync_post(url=url, data=data, headers=headers)
+        self._handle_auth_response(url, headers, data, api_response)
+
+    async def retrieve_access_token_async(self) -> None:
+        """
+        Retrieve a new access token using the refresh token, without blocking
+        the running event loop.
 
+        Raises:
+            AuthException, InvalidAPIRequestException, APIException
+        """
+        url, headers, data = self._auth_request()
+        api_response = await self.http_client.async_post(
+            url=url, data=data, headers=headers
+        )
+        self._handle_auth_response(url, headers, data, api_response)
+
+    def _handle_auth_response(
+        self, url: str, headers: dict, data: dict, api_response: APIResponse
+    ) -> None:
         if self.logging:
             self._log_request("auth", url, headers, data, api_response)
 
-        match api_response.status_code:
-            case 201:
-                access_token = api_response.data.get("access_token")
-                if not access_token:
-                    raise APIException(
-                        "Auth response missing 'access_token'."
-                        f"Response: {api_response.data}"
-                    )
-                self.access_token = access_token
-                self.token_expiry = datetime.now() + timedelta(
-                    minutes=self.ACCESS_TOKEN_TIMEOUT
-                )
-            case 400:
-                raise InvalidAPIRequestException(
-                    f"HTTP 400 Bad request: {api_response.data}"
-                )
-            case 401:
-                self._http_code_401(api_response)
-            case 422:
-                self._http_code_422(api_response)
-            case _:
-                self._http_code_unknown(api_response)
-
-    def _ensure_token_valid(self) -> None:
-        """Refresh access token if missing or expired."""
-        if not self.access_token or datetime.now() >= self.token_expiry:
-            self.retrieve_access_token()
+        handler = self._AUTH_HANDLERS.get(
+            api_response.status_code, Client._http_code_unknown
+        )
+        handler(self, api_response)
+
+    def _auth_ok(self, api_response: APIResponse, _subject: Any = None) -> None:
+        access_token = api_response.data.get("access_token")
+        if not access_token:
+            raise APIException(
+                f"Auth response missing 'access_token'.Response: {api_response.data}"
+            )
+        self.access_token = access_token
+        self.token_expiry = datetime.now() + timedelta(
+            minutes=self.ACCESS_TOKEN_TIMEOUT
+        )
+        self._dirty = True
+
+    @property
+    def access_token(self) -> str:
+        """Access token authorizing product and offer requests."""
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, value: str) -> None:
+        self._access_token = value
+        # Request headers are built once per token, not per request. The dict is
+        # shared between requests and must not be mutated.
+        self._auth_headers = {"accept": "application/json", "Bearer": value}
+
+    @property
+    def token_expiry(self) -> datetime:
+        """Wall-clock expiry of the access token (stored when dumping the client)."""
+        return self._token_expiry
+
+    @token_expiry.setter
+    def token_expiry(self, value: datetime) -> None:
+        self._token_expiry = value
+        # Expiry checks compare against a monotonic deadline: a single int
+        # comparison per request, immune to wall-clock adjustments.
+        remaining = value - datetime.now()
+        self._token_deadline_ns = time.monotonic_ns() + int(
+            remaining.total_seconds() * 1e9
+        )
+
+    def _token_expired(self) -> bool:
+        return not self.access_token or time.monotonic_ns() >= self._token_deadline_ns
+
+    def _get_auth_lock(self) -> asyncio.Lock:
+        """Return the auth lock, creating a new one per event loop."""
+        loop = asyncio.get_running_loop()
+        if self._auth_lock is None or self._auth_lock_loop is not loop:
+            self._auth_lock = asyncio.Lock()
+            self._auth_lock_loop = loop
+        return self._auth_lock
+
+    async def _ensure_token_valid_async(self) -> None:
+        """
+        Refresh access token if missing or expired.
+
+        Only one of concurrently running coroutines performs the refresh, the
+        others wait for it and reuse the new token.
+        """
+        if not self._token_expired():
+            return
+        async with self._get_auth_lock():
+            if self._token_expired():
+                await self.retrieve_access_token_async()
 
     # -------------------------------------------------------------------------
     # Product Registration
@@ -177,55 +273,60 @@ class Client:
         Raises:
             APIException, AuthException
         """
-        self._ensure_token_valid()
+        await self._ensure_token_valid_async()
 
         url = f"{self.base_url}{self.PRODUCT_REGISTER}"
-        headers = {"accept": "application/json", "Bearer": self.access_token}
-        data = {
-            "id": str(product.id),
-            "name": product.name,
-            "description": product.description,
-        }
+        headers = self._auth_headers
+        data = product.to_dict()
 
         api_response = await self.http_client.async_post(
             url=url, data=data, headers=headers
         )
+        # A cached "404 Product does not exist" for it is no longer valid.
+        self.http_client.invalidate_cache(
+            f"{self.base_url}{self.PRODUCTS}/{product.id}/offers"
+        )
 
         if self.logging:
             self._log_request("register", url, headers, data, api_response)
 
-        match api_response.status_code:
-            case 201:
-                product_id = api_response.data.get("id")
-                if product_id != str(product.id):
-                    raise APIException(
-                        f"Product registration mismatch. Sent: {product.id}, Received: {product_id}"
-                    )
-                print(f"Product {product} registered successfully.")
-            case 401:
-                self._http_code_401(api_response)
-            case 409:
-                print(f"Product {product} already registered.")
-            case 422:
-                self._http_code_422(api_response)
-            case _:
-                self._http_code_unknown(api_response)
+        handler = self._REGISTER_HANDLERS.get(
+            api_response.status_code, Client._http_code_unknown
+        )
+        handler(self, api_response, product)
+
+    def _register_ok(self, api_response: APIResponse, product: Product) -> None:
+        product_id = api_response.data.get("id")
+        if product_id != str(product.id):
+            raise APIException(
+                f"Product registration mismatch. Sent: {product.id}, Received: {product_id}"
+            )
+        print(f"Product {product} registered successfully.")
+
+    def _register_conflict(self, api_response: APIResponse, product: Product) -> None:
+        print(f"Product {product} already registered.")
 
     # -------------------------------------------------------------------------
     # Offer Retrieval
     # -------------------------------------------------------------------------
 
+    # Non-strict mode keeps accepting numeric strings, as int() did before.
+    _OFFERS_DECODER = msgspec.json.Decoder(List[Offer], strict=False)
+
+    @staticmethod
+    def _decode_offers(body: bytes) -> Any:
+        # Decodes a list of offers straight from the response bytes, without
+        # intermediate dicts. Other bodies (e.g. the {"detail": ...} of a 404)
+        # are decoded as plain JSON and left to the status handlers.
+        try:
+            return Client._OFFERS_DECODER.decode(body)
+        except msgspec.DecodeError:
+            return decode_json(body)
+
     def _parse_offers(self, data: List) -> List[Offer]:
-        offers = []
-        for item in data:
-            offers.append(
-                Offer(
-                    id=UUID(item["id"]),
-                    price=int(item["price"]),
-                    items_in_stock=int(item["items_in_stock"]),
-                )
-            )
-        return offers
+        # Offers decoded by `_decode_offers` are passed through as they are;
+        # anything else is validated and converted in C, including the UUIDs.
+        return msgspec.convert(data, List[Offer], strict=False)
 
     async def get_offers(self, product_id: UUID) -> List[Offer]:
         """
@@ -237,81 +338,154 @@ class Client:
         Returns:
             Dictionary of offers or None if not found
         """
-        self._ensure_token_valid()
+        await self._ensure_token_valid_async()
 
-        url = f"{self.base_url}{self.OFFERS.format(product_id=product_id)}"
-        headers = {"accept": "application/json", "Bearer": self.access_token}
+        url = f"{self.base_url}{self.PRODUCTS}/{product_id}/offers"
+        headers = self._auth_headers
 
-        api_response = await self.http_client.async_get(url=url, headers=headers)
+        api_response = await self.http_client.async_get(
+            url=url, headers=headers, decoder=self._decode_offers
+        )
 
         if self.logging:
             self._log_request("get_offers", url, headers, {}, api_response)
 
-        match api_response.status_code:
-            case 200:
-                try:
-                    return self._parse_offers(list(api_response.data))
-                except (KeyError, JSONDecodeError) as e:
-                    raise APIException(
-                        "Non standard json response from API. Did the docs change?\n"
-                        f"{api_response}\n"
-                        f"{e}"
-                    )
-            case 401:
-                self._http_code_401(api_response)
-            case 404:
-                print(
-                    f"Product ID {product_id} not registered. Response: {api_response.data}"
-                )
-                return []
-            case 422:
-                self._http_code_422(api_response)
-            case _:
-                self._http_code_unknown(api_response)
+        handler = self._OFFERS_HANDLERS.get(
+            api_response.status_code, Client._http_code_unknown
+        )
+        return handler(self, api_response, product_id)
+
+    async def get_offers_array(self, product_id: UUID) -> "OfferBatch":
+        """
+        Retrieve offers for a specific product as NumPy columns.
+
+        Requires the optional `numpy` dependency.
+
+        Args:
+            product_id: UUID of the product
+
+        Returns:
+            OfferBatch with one element per offer (empty if not found)
+        """
+        from .models.offer_batch import OfferBatch
+
+        return OfferBatch.from_offers(await self.get_offers(product_id))
+
+    def _offers_ok(self, api_response: APIResponse, product_id: UUID) -> List[Offer]:
+        try:
+            return self._parse_offers(api_response.data)
+        except msgspec.ValidationError as e:
+            raise APIException(
+                "Non standard json response from API. Did the docs change?\n"
+                f"{api_response}\n"
+                f"{e}"
+            )
+
+    def _offers_not_found(
+        self, api_response: APIResponse, product_id: UUID
+    ) -> List[Offer]:
+        print(f"Product ID {product_id} not registered. Response: {api_response.data}")
+        return []
 
     # -------------------------------------------------------------------------
     # Internal HTTP error handlers
     # -------------------------------------------------------------------------
 
-    def _http_code_401(self, api_response: APIResponse):
+    # Handlers take the response and the subject of the request (if any), so they
+    # can be used in the status code tables below.
+
+    def _http_code_400(self, api_response: APIResponse, _subject: Any = None):
+        raise InvalidAPIRequestException(f"HTTP 400 Bad request: {api_response.data}")
+
+    def _http_code_401(self, api_response: APIResponse, _subject: Any = None):
         raise AuthException(f"HTTP 401: Bad authentication.\n{api_response.data}")
 
-    def _http_code_422(self, api_response: APIResponse):
+    def _http_code_422(self, api_response: APIResponse, _subject: Any = None):
         # Should not be raised! - The client does not allow invalid requests!
         raise ValidationException(f"HTTP 422: Validation Error.\n{api_response.data}")
 
-    def _http_code_unknown(self, api_response: APIResponse):
+    def _http_code_unknown(self, api_response: APIResponse, _subject: Any = None):
         raise APIException(
             f"Unhandled status code {api_response.status_code}.\n{api_response.data}"
         )
 
+    # Status code -> handler tables, built once per class. Unlisted status codes
+    # are handled by `_http_code_unknown`.
+    _AUTH_HANDLERS: Dict[int, Callable[..., None]] = {
+        201: _auth_ok,
+        400: _http_code_400,
+        401: _http_code_401,
+        422: _http_code_422,
+    }
+    _REGISTER_HANDLERS: Dict[int, Callable[..., None]] = {
+        201: _register_ok,
+        401: _http_code_401,
+        409: _register_conflict,
+        422: _http_code_422,
+    }
+    _OFFERS_HANDLERS: Dict[int, Callable[..., List[Offer]]] = {
+        200: _offers_ok,
+        401: _http_code_401,
+        404: _offers_not_found,
+        422: _http_code_422,
+    }
+
+    # -------------------------------------------------------------------------
+    # Resource management
+    # -------------------------------------------------------------------------
+
+    async def aclose(self) -> None:
+        """Release resources held by the HTTP client (sessions, connection pools)."""
+        await self.http_client.aclose()
+
+    def clear_cache(self) -> None:
+        """Drop all cached `get_offers` responses."""
+        self.http_client.clear_cache()
+
+    async def __aenter__(self) -> "Client":
+        # Lets the HTTP client open a connection pool for the block.
+        await self.http_client.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
     # -------------------------------------------------------------------------
     # Serialization / JSON handling
     # -------------------------------------------------------------------------
 
-    def to_json(self) -> str:
-        """Serialize Client state to JSON string."""
-        return json.dumps(
+    def _to_json_bytes(self) -> bytes:
+        """Serialize Client state to UTF-8 encoded JSON."""
+        # orjson serializes the naive datetime to the same ISO 8601 string as
+        # `datetime.isoformat()`, which `from_json` parses back.
+        return orjson.dumps(
             {
                 "base_url": self.base_url,
                 "refresh_token": self.refresh_token,
                 "access_token": self.access_token,
-                "token_expiry": self.token_expiry.isoformat(),
+                "token_expiry": self.token_expiry,
                 "http_client_type": self.http_client_type,
                 "logging": self.logging,
                 "log_dir": self.log_dir,
             },
-            indent=4,
+            option=orjson.OPT_INDENT_2,
         )
 
+    def to_json(self) -> str:
+        """Serialize Client state to JSON string."""
+        return self._to_json_bytes().decode()
+
     @classmethod
     def from_json(cls, json_str: str) -> "Client":
         """Deserialize Client state from a JSON string."""
-        data = json.loads(json_str)
+        return cls._from_state(orjson.loads(json_str))
+
+    @classmethod
+    def _from_state(cls, data: Dict[str, Any]) -> "Client":
         obj = cls(
             refresh_token=data["refresh_token"],
             base_url=data.get("base_url", "https://python.exercise.applifting.cz"),
-            http_client_type=data.get("http_client_type", "requests"),
+            http_client_type=data.get("http_client_type", "aiohttp"),
             logging=data.get("logging", False),
             log_dir=data.get("log_dir", "logs"),
         )
@@ -321,16 +495,39 @@ class Client:
         )
         return obj
 
+    @property
+    def has_unsaved_changes(self) -> bool:
+        """Whether a new access token was retrieved since loading or saving."""
+        return self._dirty
+
     def save_to_file(self, filepath: str | Path) -> None:
-        """Save client state to a JSON file."""
+        """Save client state to a JSON file (not rewritten if already up to date)."""
         path = Path(filepath)
-        path.write_text(self.to_json(), encoding="utf-8")
+        payload = self._to_json_bytes()
+        try:
+            unchanged = (
+                path.stat().st_size == len(payload) and path.read_bytes() == payload
+            )
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            path.write_bytes(payload)
+            # A rewrite within the mtime granularity can keep both mtime and size.
+            _read_state.cache_clear()
+        self._dirty = False
 
     @classmethod
     def load_from_file(cls, filepath: str | Path) -> "Client":
-        """Load client state from a JSON file."""
-        path = Path(filepath)
-        return cls.from_json(path.read_text(encoding="utf-8"))
+        """
+        Load client state from a JSON file.
+
+        The parsed file is memoized on its path, modification time and size, so
+        loading an unchanged file again skips reading and parsing it. Every call
+        still returns a new Client.
+        """
+        path = Path(filepath).resolve()
+        stat = path.stat()
+        return cls._from_state(_read_state(str(path), stat.st_mtime_ns, stat.st_size))
 
     def __repr__(self) -> str:
         return (
@@ -1,9 +1,25 @@
 """Models subpackage for the Offers SDK."""
 
+from typing import TYPE_CHECKING, Any
+
 from .product import Product
 from .offer import Offer
 
+if TYPE_CHECKING:
+    from .offer_batch import OfferBatch
+
 __all__ = [
     "Product",
     "Offer",
+    "OfferBatch",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # OfferBatch needs the optional numpy dependency, import it only on demand.
+    if name == "OfferBatch":
+        from .offer_batch import OfferBatch
+
+        globals()["OfferBatch"] = OfferBatch
+        return OfferBatch
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,15 +4,19 @@ Offer model for the Offers SDK.
 Represents a single offer for a product including price and stock information.
 """
 
-from dataclasses import dataclass
 from uuid import UUID
 
+import msgspec
 
-@dataclass
-class Offer:
+
+class Offer(msgspec.Struct, frozen=True):
     """
     Represents an offer for a product.
 
+    A `msgspec.Struct`, so lists of offers are validated and built from API
+    payloads in a single C-level pass (see `Client.get_offers`). Offers are
+    immutable (and hashable).
+
     Attributes:
         id: Unique identifier of the offer.
         price: Price of the offer in the smallest currency unit (e.g., cents).
@@ -22,9 +26,3 @@ class Offer:
     id: UUID
     price: int
     items_in_stock: int
-
-    def __repr__(self) -> str:
-        return (
-            f"Offer(id={self.id!r}, price={self.price!r}, "
-            f"items_in_stock={self.items_in_stock!r})"
-        )
@@ -0,0 +1,63 @@
+"""
+OfferBatch model for the Offers SDK.
+
+Column-oriented (structure of arrays) representation of many offers, suited for
+aggregations like minimal price or total stock. Requires the optional `numpy`
+dependency (`pip install offers_sdk[numpy]`).
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from .offer import Offer
+
+
+@dataclass(slots=True)
+class OfferBatch:
+    """
+    Offers stored as parallel NumPy arrays, one element per offer.
+
+    Attributes:
+        ids: Object array of offer UUIDs.
+        price: int64 array of prices in the smallest currency unit (e.g., cents).
+        items_in_stock: int64 array of items currently in stock.
+    """
+
+    ids: np.ndarray
+    price: np.ndarray
+    items_in_stock: np.ndarray
+
+    @classmethod
+    def from_offers(cls, offers: Sequence[Offer]) -> "OfferBatch":
+        """Build the columns from a sequence of Offer objects."""
+        count = len(offers)
+        ids = np.empty(count, dtype=object)
+        ids[:] = [offer.id for offer in offers]
+        return cls(
+            ids=ids,
+            price=np.fromiter(
+                (offer.price for offer in offers), dtype=np.int64, count=count
+            ),
+            items_in_stock=np.fromiter(
+                (offer.items_in_stock for offer in offers),
+                dtype=np.int64,
+                count=count,
+            ),
+        )
+
+    @classmethod
+    def concatenate(cls, batches: Iterable["OfferBatch"]) -> "OfferBatch":
+        """Join several batches (e.g. offers of multiple products) into one."""
+        batches = list(batches)
+        if not batches:
+            return cls.from_offers([])
+        return cls(
+            ids=np.concatenate([batch.ids for batch in batches]),
+            price=np.concatenate([batch.price for batch in batches]),
+            items_in_stock=np.concatenate([batch.items_in_stock for batch in batches]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.price)
@@ -4,15 +4,34 @@ Product model for the Offers SDK.
 Represents a product that can be registered with the Offers API.
 """
 
+import os
+from collections import deque
 from dataclasses import dataclass
 from uuid import UUID
-from typing import Dict
+from typing import Deque, Dict, Tuple
 
+_UUID_POOL_SIZE = 1024
+_uuid_pool: Deque[UUID] = deque()
 
-@dataclass
+
+def _refill_uuid_pool() -> None:
+    # One os.urandom call for a whole batch instead of one per uuid4().
+    raw = os.urandom(16 * _UUID_POOL_SIZE)
+    _uuid_pool.extend(
+        UUID(int=int.from_bytes(raw[i : i + 16], "big"), version=4)
+        for i in range(0, len(raw), 16)
+    )
+
+
+# A forked child must not hand out the UUIDs left in its parent's pool.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+@dataclass(frozen=True)
 class Product:
     """
-    Represents a product.
+    Represents a product (immutable and hashable).
 
     Attributes:
         id: Unique identifier of the product.
@@ -20,10 +39,45 @@ class Product:
         description: Description of the product.
     """
 
+    # Written by hand instead of `slots=True`, so the extra `_id_str` slot (str(id),
+    # formatted once instead of on every serialization) is not a dataclass field.
+    __slots__ = ("id", "name", "description", "_id_str")
+
     id: UUID
     name: str
     description: str
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_id_str", str(self.id))
+
+    # Frozen instances cannot be restored with setattr, as the default would do.
+    def __getstate__(self) -> Tuple[UUID, str, str]:
+        return self.id, self.name, self.description
+
+    def __setstate__(self, state: Tuple[UUID, str, str]) -> None:
+        for name, value in zip(("id", "name", "description"), state):
+            object.__setattr__(self, name, value)
+        self.__post_init__()
+
+    @classmethod
+    def with_random_id(cls, name: str, description: str) -> "Product":
+        """
+        Create a product with a random (version 4) UUID.
+
+        The UUIDs come from a pool generated in batches, which is cheaper than
+        calling `uuid.uuid4()` per product in bulk.
+
+        Args:
+            name: Name of the product.
+            description: Description of the product.
+        """
+        try:
+            product_id = _uuid_pool.popleft()
+        except IndexError:
+            _refill_uuid_pool()
+            product_id = _uuid_pool.popleft()
+        return cls(id=product_id, name=name, description=description)
+
     def to_dict(self) -> Dict[str, str]:
         """
         Convert the Product instance into a dictionary suitable for API requests.
@@ -31,10 +85,4 @@ class Product:
         Returns:
             Dictionary containing the product's id, name, and description.
         """
-        return {"id": str(self.id), "name": self.name, "description": self.description}
-
-    def __repr__(self) -> str:
-        return (
-            f"Product(id={self.id!r}, name={self.name!r}, "
-            f"description={self.description!r})"
-        )
+        return {"id": self._id_str, "name": self.name, "description": self.description}
@@ -1,15 +1,43 @@
-"""Services subpackage providing HTTP client implementations and API responses."""
+"""Services subpackage providing HTTP client implementations and API responses.
+
+The HTTP client implementations are imported lazily on first attribute access,
+so only the library of the backend actually in use (`aiohttp`, `httpx` or
+`requests`) gets imported.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from .api_response import APIResponse
 from .http_client_interface import IHttpClient
-from .aio_http_client import AioHttpClient
-from .httpx_client import HttpxClient
-from .requests_client import RequestsClient
+from .response_cache import ResponseCache
+
+if TYPE_CHECKING:
+    from .aio_http_client import AioHttpClient
+    from .httpx_client import HttpxClient
+    from .requests_client import RequestsClient
+
+_LAZY_MODULES = {
+    "AioHttpClient": "aio_http_client",
+    "HttpxClient": "httpx_client",
+    "RequestsClient": "requests_client",
+}
 
 __all__ = [
     "APIResponse",
     "IHttpClient",
+    "ResponseCache",
     "AioHttpClient",
     "HttpxClient",
     "RequestsClient",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
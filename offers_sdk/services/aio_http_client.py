@@ -2,26 +2,100 @@
 Asynchronous HTTP client using aiohttp.
 
 Implements the IHttpClient interface to perform async GET/POST requests.
+Inside `async with client:` a single `aiohttp.ClientSession` (and its connection
+pool) is shared by all requests and closed on exit; outside of it every request
+uses a short-lived session. GET responses are served from the response cache
+when one is given.
 """
 
-from typing import Any, Dict, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
 import asyncio
+import atexit
+import threading
 import aiohttp
 
 from .api_response import APIResponse
 from .http_client_interface import IHttpClient
+from .json_body import decode_json, encode_json
+from .response_cache import ResponseCache
+
+# Event loop of `sync_post`, shared by all clients. The lock is held while the loop
+# runs, as one loop cannot run in two threads at once.
+_sync_lock = threading.Lock()
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run_sync(coro: Any) -> Any:
+    """Run a coroutine to completion on the shared `sync_post` loop."""
+    global _sync_loop
+    with _sync_lock:
+        loop = _sync_loop
+        if loop is None or loop.is_closed():
+            loop = _sync_loop = asyncio.new_event_loop()
+        return loop.run_until_complete(coro)
+
+
+@atexit.register
+def _close_sync_loop() -> None:
+    global _sync_loop
+    with _sync_lock:
+        loop, _sync_loop = _sync_loop, None
+        if loop is not None:
+            loop.close()
 
 
 class AioHttpClient(IHttpClient):
     """
     Async HTTP client using aiohttp for network calls.
+
+    Entering the client (`async with`) creates a pooled session that is reused
+    by all requests until the block exits. A session is bound to the event loop
+    it was created in, so outside of such a block (e.g. one `asyncio.run` per
+    call) each request uses its own session, closed right after the request.
+
+    `sync_post` runs on an event loop shared by all clients of the process, created
+    once and reused instead of setting up and tearing down a loop with
+    `asyncio.run` per call.
+
+    Args:
+        cache: Cache for GET responses (None, the default, disables caching).
     """
 
+    def __init__(self, cache: Optional[ResponseCache] = None) -> None:
+        self.cache = cache
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AioHttpClient":
+        """Open the pooled session used by all requests until `aclose()`."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+            )
+        return self
+
+    async def aclose(self) -> None:
+        """Close the pooled session and its connections."""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+
+    @asynccontextmanager
+    async def _session_scope(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the pooled session, or a short-lived one outside `async with`."""
+        session = self._session
+        if session is not None and not session.closed:
+            yield session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
+
     async def async_get(
         self,
         url: str,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        decoder: Optional[Callable[[bytes], Any]] = None,
     ) -> APIResponse:
         """
         Perform an asynchronous GET request.
@@ -30,18 +104,26 @@ class AioHttpClient(IHttpClient):
             url: Target URL.
             params: Optional query parameters.
             headers: Optional HTTP headers.
+            decoder: Optional function decoding the raw body (default: JSON).
 
         Returns:
             APIResponse: Contains JSON data and HTTP status code.
         """
+        cache = self.cache
+        if cache is not None:
+            key, cached, headers = cache.lookup(url, params, headers)
+            if cached is not None:
+                return cached
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, headers=headers) as response:
-                    try:
-                        data = await response.json(content_type=None)
-                    except Exception:
-                        data = {}
-                    return APIResponse(data=data, status_code=response.status)
+            async with (
+                self._session_scope() as session,
+                session.get(url, params=params, headers=headers) as response,
+            ):
+                data = (decoder or decode_json)(await response.read())
+                api_response = APIResponse(data=data, status_code=response.status)
+                if cache is not None:
+                    return cache.store(key, api_response, response.headers)
+                return api_response
         except Exception as e:
             return APIResponse(data={"error": str(e)}, status_code=500)
 
@@ -63,13 +145,8 @@ class AioHttpClient(IHttpClient):
             APIResponse: Contains JSON data and HTTP status code.
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=data, headers=headers) as response:
-                    try:
-                        resp_data = await response.json(content_type=None)
-                    except Exception:
-                        resp_data = {}
-                    return APIResponse(data=resp_data, status_code=response.status)
+            async with self._session_scope() as session:
+                return await self._post(session, url, data, headers)
         except Exception as e:
             return APIResponse(data={"error": str(e)}, status_code=500)
 
@@ -90,4 +167,38 @@ class AioHttpClient(IHttpClient):
         Returns:
             APIResponse: Contains JSON data and HTTP status code.
         """
-        return asyncio.run(self.async_post(url, data=data, headers=headers))
+        return _run_sync(self._sync_post(url, data, headers))
+
+    async def _sync_post(
+        self,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+    ) -> APIResponse:
+        # Runs on the shared loop of `sync_post`; the pooled session of the async
+        # API belongs to another loop, so a short-lived session is used.
+        try:
+            async with aiohttp.ClientSession() as session:
+                return await self._post(session, url, data, headers)
+        except Exception as e:
+            return APIResponse(data={"error": str(e)}, status_code=500)
+
+    async def _post(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+    ) -> APIResponse:
+        body, headers = encode_json(data, headers)
+        try:
+            async with session.post(url, data=body, headers=headers) as response:
+                resp_data = await self._read_json(response)
+                return APIResponse(data=resp_data, status_code=response.status)
+        except Exception as e:
+            return APIResponse(data={"error": str(e)}, status_code=500)
+
+    @staticmethod
+    async def _read_json(response: aiohttp.ClientResponse) -> Any:
+        """Read the response body and decode it ({} if empty or not JSON)."""
+        return decode_json(await response.read())
@@ -8,11 +8,13 @@ from dataclasses import dataclass
 from typing import Dict, Any, Union, List
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class APIResponse:
     """
     Represents the result of an API call.
 
+    Immutable, as cached responses are shared between callers.
+
     Attributes:
         data: Parsed JSON response from the API.
         status_code: HTTP status code returned by the API.
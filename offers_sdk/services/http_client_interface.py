@@ -5,21 +5,27 @@ Defines required methods for synchronous and asynchronous HTTP operations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 from .api_response import APIResponse
+from .response_cache import ResponseCache
 
 
 class IHttpClient(ABC):
     """
     Abstract base class for HTTP clients used in the SDK.
+
+    Implementations serve `async_get` from `cache` when it is set.
     """
 
+    cache: Optional[ResponseCache] = None
+
     @abstractmethod
     async def async_get(
         self,
         url: str,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        decoder: Optional[Callable[[bytes], Any]] = None,
     ) -> APIResponse:
         """
         Perform an asynchronous HTTP GET request.
@@ -28,6 +34,8 @@ class IHttpClient(ABC):
             url: URL to send the GET request to.
             params: Optional query parameters.
             headers: Optional HTTP headers.
+            decoder: Optional function decoding the raw response body, e.g. into
+                typed objects. Defaults to JSON decoding ({} if empty or invalid).
 
         Returns:
             APIResponse: The result of the HTTP request.
@@ -73,3 +81,27 @@ class IHttpClient(ABC):
             APIResponse: The result of the HTTP request.
         """
         pass
+
+    def invalidate_cache(self, url: str) -> None:
+        """Drop cached GET responses for a URL."""
+        if self.cache is not None:
+            self.cache.invalidate(url)
+
+    def clear_cache(self) -> None:
+        """Drop all cached GET responses."""
+        if self.cache is not None:
+            self.cache.clear()
+
+    async def aclose(self) -> None:
+        """
+        Release resources held by the client (sessions, connection pools).
+
+        Clients without persistent resources do not need to override this.
+        """
+        pass
+
+    async def __aenter__(self) -> "IHttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
@@ -2,23 +2,159 @@
 HTTP client implementation using the httpx library.
 
 Provides synchronous and asynchronous HTTP request methods by implementing
-the IHttpClient interface.
+the IHttpClient interface. By default all `HttpxClient` instances share one
+process-wide `httpx.AsyncClient` (per event loop) and one `httpx.Client`, so
+their connection pools are reused across clients and requests. GET responses
+are served from the response cache when one is given.
+
+Setting the `OFFERS_SDK_HTTP2=1` environment variable makes the shared async
+client use HTTP/2 (requires the `h2` package, `pip install offers-sdk[http2]`), so
+concurrent requests are multiplexed over a few connections to the API host.
+
+The shared clients do not store cookies, as they would otherwise be sent on the
+requests of every `Client` (i.e. every refresh token) in the process.
 """
 
-from typing import Any, Dict, Optional
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import atexit
+import os
+import threading
 import httpx
 from .http_client_interface import IHttpClient
 from .api_response import APIResponse
+from .json_body import decode_json, encode_json
+from .response_cache import ResponseCache
+
+LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+# HTTP/2 multiplexes requests, so far fewer connections are needed.
+HTTP2_LIMITS = httpx.Limits(
+    max_keepalive_connections=10, max_connections=50, keepalive_expiry=30
+)
+
+_shared_lock = threading.Lock()
+_shared_async_client: Optional[httpx.AsyncClient] = None
+_shared_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_sync_client: Optional[httpx.Client] = None
+
+
+def _no_cookies() -> CookieJar:
+    """Cookie jar of the shared clients, rejecting every cookie it is given."""
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+def _new_async_client() -> httpx.AsyncClient:
+    if os.getenv("OFFERS_SDK_HTTP2") == "1":
+        return httpx.AsyncClient(http2=True, limits=HTTP2_LIMITS, cookies=_no_cookies())
+    return httpx.AsyncClient(limits=LIMITS, cookies=_no_cookies())
+
+
+def _new_sync_client() -> httpx.Client:
+    return httpx.Client(limits=LIMITS, cookies=_no_cookies())
+
+
+def get_shared_async_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide async client for the running event loop.
+
+    An `httpx.AsyncClient` must not be shared between event loops, so a new one is
+    created when called from another loop (e.g. by consecutive `asyncio.run` calls).
+    """
+    global _shared_async_client, _shared_async_client_loop
+    loop = asyncio.get_running_loop()
+    client = _shared_async_client
+    if client is None or client.is_closed or _shared_async_client_loop is not loop:
+        with _shared_lock:
+            client = _shared_async_client
+            if (
+                client is None
+                or client.is_closed
+                or _shared_async_client_loop is not loop
+            ):
+                client = _shared_async_client = _new_async_client()
+                _shared_async_client_loop = loop
+    return client
+
+
+def get_shared_sync_client() -> httpx.Client:
+    """Return the process-wide sync client, creating it if needed."""
+    global _shared_sync_client
+    client = _shared_sync_client
+    if client is None or client.is_closed:
+        with _shared_lock:
+            client = _shared_sync_client
+            if client is None or client.is_closed:
+                client = _shared_sync_client = _new_sync_client()
+    return client
+
+
+async def _close_shared_async_client() -> None:
+    """Close the shared async client if it belongs to the running loop."""
+    global _shared_async_client, _shared_async_client_loop
+    with _shared_lock:
+        client = _shared_async_client
+        if (
+            client is None
+            or _shared_async_client_loop is not asyncio.get_running_loop()
+        ):
+            return
+        _shared_async_client = _shared_async_client_loop = None
+    await client.aclose()
+
+
+@atexit.register
+def _close_shared_sync_client() -> None:
+    # The async client is bound to a loop that is gone at exit; only the sync
+    # client can be closed here.
+    if _shared_sync_client is not None:
+        _shared_sync_client.close()
 
 
 class HttpxClient(IHttpClient):
-    """HTTP client using httpx supporting both asynchronous and synchronous calls."""
+    """
+    HTTP client using httpx supporting both asynchronous and synchronous calls.
+
+    Args:
+        client: Async client to use instead of the shared one. It is owned by the
+            caller and not closed by `aclose()`.
+        sync_client: Sync client to use instead of the shared one, likewise owned
+            by the caller.
+        cache: Cache for GET responses (None, the default, disables caching).
+    """
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        sync_client: Optional[httpx.Client] = None,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
+        self.cache = cache
+        self._client = client
+        self._sync_client = sync_client
+
+    def _get_client(self) -> httpx.AsyncClient:
+        return self._client or get_shared_async_client()
+
+    def _get_sync_client(self) -> httpx.Client:
+        return self._sync_client or get_shared_sync_client()
+
+    async def aclose(self) -> None:
+        """
+        Release the shared async connection pool of the running event loop.
+
+        The pool cannot outlive its loop anyway; it is recreated on next use. The
+        shared sync client stays open until interpreter exit.
+        """
+        if self._client is None:
+            await _close_shared_async_client()
 
     async def async_get(
         self,
         url: str,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        decoder: Optional[Callable[[bytes], Any]] = None,
     ) -> APIResponse:
         """Perform an asynchronous HTTP GET request.
 
@@ -26,17 +162,26 @@ class HttpxClient(IHttpClient):
             url (str): The target URL.
             params (Optional[Dict[str, Any]]): Query parameters for the request.
             headers (Optional[Dict[str, str]]): HTTP headers to include.
+            decoder (Optional[Callable[[bytes], Any]]): Function decoding the raw
+                body (default: JSON).
 
         Returns:
             APIResponse: The response containing the status code and parsed JSON data.
         """
+        cache = self.cache
+        if cache is not None:
+            key, cached, headers = cache.lookup(url, params, headers)
+            if cached is not None:
+                return cached
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, headers=headers)
-                return APIResponse(
-                    data=response.json() if response.content else {},
-                    status_code=response.status_code,
-                )
+            response = await self._get_client().get(url, params=params, headers=headers)
+            api_response = APIResponse(
+                data=(decoder or decode_json)(await response.aread()),
+                status_code=response.status_code,
+            )
+            if cache is not None:
+                return cache.store(key, api_response, response.headers)
+            return api_response
         except httpx.RequestError as exc:
             return APIResponse(data={"error": str(exc)}, status_code=500)
 
@@ -57,12 +202,12 @@ class HttpxClient(IHttpClient):
             APIResponse: The response containing the status code and parsed JSON data.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=data, headers=headers)
-                return APIResponse(
-                    data=response.json() if response.content else {},
-                    status_code=response.status_code,
-                )
+            body, headers = encode_json(data, headers)
+            response = await self._get_client().post(url, content=body, headers=headers)
+            return APIResponse(
+                data=decode_json(await response.aread()),
+                status_code=response.status_code,
+            )
         except httpx.RequestError as exc:
             return APIResponse(data={"error": str(exc)}, status_code=500)
 
@@ -83,11 +228,11 @@ class HttpxClient(IHttpClient):
             APIResponse: The response containing the status code and parsed JSON data.
         """
         try:
-            with httpx.Client() as client:
-                response = client.post(url, json=data, headers=headers)
-                return APIResponse(
-                    data=response.json() if response.content else {},
-                    status_code=response.status_code,
-                )
+            body, headers = encode_json(data, headers)
+            response = self._get_sync_client().post(url, content=body, headers=headers)
+            return APIResponse(
+                data=decode_json(response.read()),
+                status_code=response.status_code,
+            )
         except httpx.RequestError as e:
             return APIResponse(data={"error": str(e)}, status_code=500)
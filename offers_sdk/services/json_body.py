@@ -0,0 +1,45 @@
+"""
+JSON encoding of request bodies and decoding of response bodies, shared by the
+HTTP client implementations.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+
+def encode_json(
+    data: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]
+) -> Tuple[Optional[bytes], Optional[Dict[str, str]]]:
+    """
+    Encode a JSON request body with orjson instead of the HTTP library's `json=`.
+
+    Args:
+        data: JSON payload (None for no body).
+        headers: Request headers.
+
+    Returns:
+        The encoded body and the headers with `Content-Type` set (both unchanged
+        if there is no payload).
+    """
+    if data is None:
+        return None, headers
+    return orjson.dumps(data), {**(headers or {}), "Content-Type": "application/json"}
+
+
+def decode_json(body: bytes) -> Any:
+    """
+    Decode a response body read once into memory.
+
+    Args:
+        body: Raw response body.
+
+    Returns:
+        The decoded JSON, or an empty dict for empty or non-JSON bodies.
+    """
+    if not body:
+        return {}
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return {}
@@ -2,34 +2,124 @@
 Synchronous and asynchronous HTTP client using requests.
 
 Implements IHttpClient interface by leveraging `requests` for sync calls and
-`asyncio.to_thread` for async calls.
+running them in a dedicated thread pool for async calls. For natively async I/O
+use `AioHttpClient` or `HttpxClient` instead. By default all `RequestsClient`
+instances share one process-wide `requests.Session` and its connection pool. It
+does not store cookies, as they would otherwise be sent on the requests of every
+`Client` (i.e. every refresh token) in the process. GET responses are served from
+the response cache when one is given.
+
+The thread pool size is read from the `OFFERS_SDK_THREAD_POOL_SIZE` environment
+variable (default 64).
 """
 
 import requests
 import asyncio
-from typing import Any, Dict, Optional
+import atexit
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from .http_client_interface import IHttpClient
 from .api_response import APIResponse
+from .json_body import decode_json, encode_json
+from .response_cache import ResponseCache
+
+_shared_lock = threading.Lock()
+_shared_session: Optional[requests.Session] = None
+
+# Retries connection errors and gateway failures. Status based retries are limited
+# to GET so a product registration that may have reached the API is not repeated.
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
+)
+
+
+def _new_session() -> requests.Session:
+    session = requests.Session()
+    session.headers["Accept"] = "application/json"
+    # Cookies set for one Client must not be sent by the others sharing the session.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=100, max_retries=RETRY)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_shared_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use."""
+    global _shared_session
+    session = _shared_session
+    if session is None:
+        with _shared_lock:
+            session = _shared_session
+            if session is None:
+                session = _new_session()
+                atexit.register(session.close)
+                _shared_session = session
+    return session
 
 
 class RequestsClient(IHttpClient):
     """
     HTTP client using the requests library.
 
-    Provides both synchronous and asynchronous methods for compatibility.
+    Provides both synchronous and asynchronous methods for compatibility. The
+    async methods run the blocking calls in a worker thread of the client's own
+    executor, so at most `OFFERS_SDK_THREAD_POOL_SIZE` requests are in flight
+    (instead of the `min(32, cpu_count + 4)` of asyncio's default executor).
+
+    Args:
+        session: Session to use instead of the shared one (owned by the caller).
+        cache: Cache for GET responses (None, the default, disables caching).
     """
 
-    def __init__(self) -> None:
-        self.session = requests.Session()
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
+        self.cache = cache
+        self.session = session or get_shared_session()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the I/O thread pool, creating it on first use."""
+        executor = self._executor
+        if executor is None:
+            executor = self._executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv("OFFERS_SDK_THREAD_POOL_SIZE", "64")),
+                thread_name_prefix="offers-sdk-io",
+            )
+        return executor
+
+    async def aclose(self) -> None:
+        """Shut down the I/O thread pool (recreated if the client is used again)."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
 
     async def async_get(
         self,
         url: str,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        decoder: Optional[Callable[[bytes], Any]] = None,
     ) -> APIResponse:
-        return await asyncio.to_thread(self._get_sync, url, params, headers)
+        return await self._run_in_executor(
+            self._get_sync, url, params, headers, decoder
+        )
 
     async def async_post(
         self,
@@ -37,7 +127,21 @@ class RequestsClient(IHttpClient):
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> APIResponse:
-        return await asyncio.to_thread(self._post_sync, url, data, headers)
+        return await self._run_in_executor(self._post_sync, url, data, headers)
+
+    async def _run_in_executor(
+        self, func: Callable[..., APIResponse], *args: Any
+    ) -> APIResponse:
+        # Like `asyncio.to_thread`, but the context is only carried over to the
+        # worker thread (via a partial of `ctx.run`) when context variables are
+        # actually set, which is not the case for plain SDK use.
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        if not ctx:
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        return await loop.run_in_executor(
+            self._get_executor(), functools.partial(ctx.run, func, *args)
+        )
 
     def sync_post(
         self,
@@ -52,18 +156,19 @@ class RequestsClient(IHttpClient):
         url: str,
         params: Optional[Dict[str, Any]],
         headers: Optional[Dict[str, str]],
+        decoder: Optional[Callable[[bytes], Any]] = None,
     ) -> APIResponse:
-        try:
-            resp = self.session.get(url, params=params, headers=headers)
-            return APIResponse(
-                data=resp.json() if resp.content else {},
-                status_code=resp.status_code,
-            )
-        except requests.RequestException as e:
-            return APIResponse(
-                data={"error": str(e)},
-                status_code=getattr(e.response, "status_code", -1),
-            )
+        cache = self.cache
+        if cache is not None:
+            key, cached, headers = cache.lookup(url, params, headers)
+            if cached is not None:
+                return cached
+        api_response, resp_headers = self._request(
+            "GET", url, decoder or decode_json, params=params, headers=headers
+        )
+        if cache is not None and resp_headers is not None:
+            return cache.store(key, api_response, resp_headers)
+        return api_response
 
     def _post_sync(
         self,
@@ -71,14 +176,37 @@ class RequestsClient(IHttpClient):
         data: Optional[Dict[str, Any]],
         headers: Optional[Dict[str, str]],
     ) -> APIResponse:
+        body, headers = encode_json(data, headers)
+        return self._request("POST", url, decode_json, data=body, headers=headers)[0]
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        decoder: Callable[[bytes], Any],
+        **kwargs: Any,
+    ) -> Tuple[APIResponse, Optional[Mapping[str, str]]]:
+        """
+        Send a request and wrap the outcome in an APIResponse.
+
+        requests does not raise for 4xx/5xx statuses, so only transport failures
+        (connection errors, timeouts) take the exception path; statuses are left
+        to the handlers of `Client`.
+
+        Returns:
+            The response and its headers (None if the request failed).
+        """
         try:
-            resp = self.session.post(url, json=data, headers=headers)
-            return APIResponse(
-                data=resp.json() if resp.content else {},
-                status_code=resp.status_code,
-            )
+            resp = self.session.request(method, url, **kwargs)
         except requests.RequestException as e:
-            return APIResponse(
-                data={"error": str(e)},
-                status_code=getattr(e.response, "status_code", -1),
+            return (
+                APIResponse(
+                    data={"error": str(e)},
+                    status_code=getattr(e.response, "status_code", -1),
+                ),
+                None,
             )
+        return (
+            APIResponse(data=decoder(resp.content), status_code=resp.status_code),
+            resp.headers,
+        )
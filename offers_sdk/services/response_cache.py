@@ -0,0 +1,246 @@
+"""
+In-memory HTTP response cache for GET requests.
+
+Successful responses are kept in an LRU cache for as long as their
+`Cache-Control: max-age` / `Expires` headers allow (a default TTL when the API
+sends neither). Stale entries with an `ETag` or `Last-Modified` header are
+revalidated with a conditional request; a `304 Not Modified` answer reuses the
+cached body. `404` responses are kept briefly in a separate negative cache.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Hashable, Mapping, Optional, Set, Tuple
+
+from .api_response import APIResponse
+
+
+@dataclass(slots=True)
+class _Entry:
+    response: APIResponse
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+def _freshness(headers: Mapping[str, str], default_ttl: float) -> Optional[float]:
+    """Return the freshness lifetime in seconds, or None if it must not be stored."""
+    cache_control = (headers.get("Cache-Control") or "").lower()
+    directives = {}
+    for part in cache_control.split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name] = value.strip('"')
+
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+
+    try:
+        age = float(headers.get("Age") or 0)
+    except ValueError:
+        age = 0.0
+
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            return max(float(max_age) - age, 0.0)
+        except ValueError:
+            return 0.0
+
+    expires = headers.get("Expires")
+    if expires is not None:
+        try:
+            expires_at = parsedate_to_datetime(expires)
+            date = headers.get("Date")
+            now = parsedate_to_datetime(date) if date else None
+            if now is None:
+                return max(expires_at.timestamp() - time.time(), 0.0)
+            return max((expires_at - now).total_seconds(), 0.0)
+        except (TypeError, ValueError):
+            # Invalid dates (e.g. "0") mean already expired.
+            return 0.0
+
+    return default_ttl
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU + TTL cache of GET responses.
+
+    Entries are keyed on the URL, query parameters and request headers, so
+    responses are never shared between different access tokens. Caching is opt-in:
+    pass an instance as the `cache` of an HTTP client to enable it.
+
+    Args:
+        maxsize: Maximum number of cached successful responses.
+        ttl: Lifetime in seconds of responses without caching headers.
+        negative_maxsize: Maximum number of cached `404` responses.
+        negative_ttl: Lifetime in seconds of cached `404` responses.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        negative_maxsize: int = 256,
+        negative_ttl: float = 10.0,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_maxsize = negative_maxsize
+        self.negative_ttl = negative_ttl
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._negative: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        # Keys of both caches by URL, so `invalidate()` does not scan all entries.
+        self._keys_by_url: Dict[str, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+    ) -> Hashable:
+        return (
+            url,
+            tuple(sorted(params.items())) if params else (),
+            tuple(sorted(headers.items())) if headers else (),
+        )
+
+    def _put(
+        self,
+        entries: "OrderedDict[Hashable, _Entry]",
+        key: Hashable,
+        entry: _Entry,
+        maxsize: int,
+    ) -> None:
+        """Insert an entry, evicting the least recently used ones (lock held)."""
+        entries[key] = entry
+        entries.move_to_end(key)
+        self._keys_by_url.setdefault(key[0], set()).add(key)
+        while len(entries) > maxsize:
+            self._unindex(entries.popitem(last=False)[0])
+
+    def _pop(self, entries: "OrderedDict[Hashable, _Entry]", key: Hashable) -> None:
+        """Remove an entry if present (lock held)."""
+        if entries.pop(key, None) is not None:
+            self._unindex(key)
+
+    def _unindex(self, key: Hashable) -> None:
+        # A key can be in both caches (stale 200 entry plus a newer 404).
+        if key in self._entries or key in self._negative:
+            return
+        keys = self._keys_by_url.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_url[key[0]]
+
+    def lookup(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Hashable, Optional[APIResponse], Optional[Dict[str, str]]]:
+        """
+        Look up a GET request.
+
+        Returns:
+            The cache key, the cached response if still fresh (else None), and the
+            headers to send, with conditional headers added for stale entries.
+        """
+        key = self._key(url, params, headers)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._negative.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    return key, entry.response, headers
+                self._pop(self._negative, key)
+
+            entry = self._entries.get(key)
+            if entry is None:
+                return key, None, headers
+            self._entries.move_to_end(key)
+            if entry.expires_at > now:
+                return key, entry.response, headers
+            etag, last_modified = entry.etag, entry.last_modified
+
+        conditional = dict(headers or {})
+        if etag is not None:
+            conditional["If-None-Match"] = etag
+        if last_modified is not None:
+            conditional["If-Modified-Since"] = last_modified
+        return key, None, conditional
+
+    def store(
+        self,
+        key: Hashable,
+        response: APIResponse,
+        headers: Mapping[str, str],
+    ) -> APIResponse:
+        """
+        Store the response of a request made after `lookup()`.
+
+        Args:
+            key: Cache key returned by `lookup()`.
+            response: Response received from the API.
+            headers: Response headers (case-insensitive mapping).
+
+        Returns:
+            The response to hand to the caller; for `304 Not Modified` this is the
+            revalidated cached response.
+        """
+        status = response.status_code
+        if status not in (200, 304, 404):
+            return response
+
+        now = time.monotonic()
+        with self._lock:
+            if status == 404:
+                entry = _Entry(response, now + self.negative_ttl)
+                self._put(self._negative, key, entry, self.negative_maxsize)
+                return response
+
+            ttl = _freshness(headers, self.ttl)
+            if status == 304:
+                entry = self._entries.get(key)
+                if entry is None:
+                    return response
+                if ttl is None:
+                    self._pop(self._entries, key)
+                else:
+                    entry.expires_at = now + ttl
+                return entry.response
+
+            if ttl is None:
+                self._pop(self._entries, key)
+                return response
+            etag = headers.get("ETag")
+            last_modified = headers.get("Last-Modified")
+            # Nothing to revalidate with: an already stale entry is useless.
+            if ttl <= 0 and etag is None and last_modified is None:
+                self._pop(self._entries, key)
+                return response
+            entry = _Entry(response, now + ttl, etag, last_modified)
+            self._put(self._entries, key, entry, self.maxsize)
+        return response
+
+    def invalidate(self, url: str) -> None:
+        """Drop all cached responses (including `404`s) for a URL."""
+        with self._lock:
+            for key in self._keys_by_url.pop(url, ()):
+                self._entries.pop(key, None)
+                self._negative.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._negative.clear()
+            self._keys_by_url.clear()
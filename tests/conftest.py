@@ -1,5 +1,9 @@
+import asyncio
+
 import pytest
 
+from offers_sdk.client import Client
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -11,6 +15,51 @@ def pytest_addoption(parser):
     )
 
 
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "integration: test against the live API (run with -m integration)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Live API tests only run when selected explicitly, e.g. `-m integration`.
+    if "integration" in config.getoption("markexpr"):
+        return
+    skip_integration = pytest.mark.skip(reason="live API test, use -m integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
 @pytest.fixture(scope="session")
 def client_type(pytestconfig):
     return pytestconfig.getoption("client")
+
+
+@pytest.fixture(scope="module")
+def client_loop():
+    """
+    Event loop shared by the tests of a module.
+
+    Pooled connections are bound to the loop they were opened on, so all calls of
+    the shared `authed_client` (and its teardown) run on this one loop.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def authed_client(client_type, client_loop):
+    """
+    Client with the access token saved by `test_02_auth_requests.py`, shared by
+    the tests of a module. Run its calls with `client_loop.run_until_complete`.
+
+    It is loaded rather than re-authenticated, as the API refuses repeated
+    authentication within its cooldown period. Its connection pool is opened on
+    `client_loop` and closed when the module finishes.
+    """
+    client = Client.load_from_file(f"dumped_clients/{client_type}_w_access_token.json")
+    client_loop.run_until_complete(client.__aenter__())
+    yield client
+    client_loop.run_until_complete(client.__aexit__(None, None, None))
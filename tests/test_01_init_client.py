@@ -6,10 +6,19 @@ These tests ensure that:
 2. Invalid client types raise the appropriate exception.
 """
 
+import io
+import os
+from http.client import parse_headers
+
+import httpx
 import pytest
+import requests
+from requests.cookies import MockRequest, MockResponse
 from offers_sdk.client import Client
 from offers_sdk.services import AioHttpClient, HttpxClient, RequestsClient
 from offers_sdk.exceptions import InvalidClientTypeException
+from offers_sdk.services.httpx_client import get_shared_sync_client
+from offers_sdk.services.requests_client import get_shared_session
 
 
 def test_init_requests() -> None:
@@ -49,3 +58,59 @@ def test_init_nonsense() -> None:
     """
     with pytest.raises(InvalidClientTypeException):
         Client.load_from_file("dumped_clients/nonsense_http_client.json")
+
+
+def test_clients_share_connection_pool() -> None:
+    """
+    Test that separately loaded clients reuse the same underlying session.
+    """
+    first = Client.load_from_file("dumped_clients/requests.json")
+    second = Client.load_from_file("dumped_clients/requests.json")
+    assert (
+        first.http_client.session is second.http_client.session
+    ), "RequestsClient instances should share the module-level session."
+
+
+def test_shared_pools_do_not_store_cookies() -> None:
+    """
+    Test that cookies set on a response are not kept by the shared sessions, as
+    they would be sent on the requests of every other Client.
+    """
+    url = "https://python.exercise.applifting.cz/api/v1/auth"
+    set_cookie = b"Set-Cookie: session=abc\r\n\r\n"
+
+    httpx_client = get_shared_sync_client()
+    httpx_client.cookies.extract_cookies(
+        httpx.Response(
+            200,
+            headers={"Set-Cookie": "session=abc"},
+            request=httpx.Request("GET", url),
+        )
+    )
+    assert not httpx_client.cookies
+
+    session = get_shared_session()
+    session.cookies.extract_cookies(
+        MockResponse(parse_headers(io.BytesIO(set_cookie))),
+        MockRequest(requests.Request("GET", url).prepare()),
+    )
+    assert not session.cookies
+
+
+def test_load_from_file_picks_up_changes(tmp_path) -> None:
+    """
+    Test that reloading a saved client file reflects changes made to it.
+    """
+    path = tmp_path / "client.json"
+    client = Client(refresh_token="first-token")
+    client.save_to_file(path)
+    assert Client.load_from_file(path).refresh_token == "first-token"
+    stat = path.stat()
+
+    # Same length and (as on filesystems with coarse timestamps) same mtime.
+    client.refresh_token = "other-token"
+    client.save_to_file(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    loaded = Client.load_from_file(path)
+    assert loaded.refresh_token == "other-token"
+    assert loaded is not Client.load_from_file(path)
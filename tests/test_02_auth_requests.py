@@ -11,6 +11,8 @@ import pytest
 from offers_sdk.client import Client
 from offers_sdk.exceptions import AuthException, InvalidAPIRequestException
 
+pytestmark = pytest.mark.integration
+
 
 def test_wrong_refresh_token(client_type: str) -> None:
     """
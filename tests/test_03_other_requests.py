@@ -12,68 +12,79 @@ import asyncio
 from offers_sdk.client import Client
 from offers_sdk.models import Product, Offer
 
+pytestmark = pytest.mark.integration
 
-def test_register_product(client_type: str) -> None:
+
+def test_register_product(
+    authed_client: Client, client_loop: asyncio.AbstractEventLoop
+) -> None:
     """
     Register a new product with the API.
 
     Args:
-        client_type: Type of HTTP client ('requests', 'httpx', or 'aiohttp').
+        authed_client: Authenticated client shared by the module.
+        client_loop: Event loop the shared client runs on.
 
     Notes:
         - The registration should either succeed (201) or return conflict (409)
           if the product was already registered.
     """
-    client = Client.load_from_file(f"dumped_clients/{client_type}_w_access_token.json")
+    client = authed_client
 
     product = Product(
         id=uuid.uuid4(), name="Test Product", description="Registered from pytest"
     )
 
-    asyncio.run(client.register_product(product))
+    client_loop.run_until_complete(client.register_product(product))
 
 
-def test_register_product_conflict(client_type: str) -> None:
+def test_register_product_conflict(
+    authed_client: Client, client_loop: asyncio.AbstractEventLoop
+) -> None:
     """
     Register the same product twice. The first call should succeed, the second
     call should report a conflict (409) but not raise an exception.
 
     Args:
-        client_type: Type of HTTP client.
+        authed_client: Authenticated client shared by the module.
+        client_loop: Event loop the shared client runs on.
     """
-    client = Client.load_from_file(f"dumped_clients/{client_type}_w_access_token.json")
+    client = authed_client
 
     product_id = uuid.uuid4()
     product = Product(id=product_id, name="Double Product", description="Conflict test")
 
     # First registration
-    asyncio.run(client.register_product(product))
+    client_loop.run_until_complete(client.register_product(product))
 
     # Second registration should trigger conflict handling
-    asyncio.run(client.register_product(product))
+    client_loop.run_until_complete(client.register_product(product))
 
 
-def test_get_offers_existing_product(client_type: str) -> None:
+def test_get_offers_existing_product(
+    authed_client: Client, client_loop: asyncio.AbstractEventLoop
+) -> None:
     """
     Retrieve offers for an existing product. The product is first registered.
 
     Args:
-        client_type: Type of HTTP client.
+        authed_client: Authenticated client shared by the module.
+        client_loop: Event loop the shared client runs on.
 
     Notes:
         - The call should succeed and return offers or an empty list.
     """
-    client = Client.load_from_file(f"dumped_clients/{client_type}_w_access_token.json")
+    client = authed_client
 
     product = Product(
         id=uuid.uuid4(), name="Product With Offers", description="Testing get_offers"
     )
 
     # Register product first
-    asyncio.run(client.register_product(product))
+    client_loop.run_until_complete(client.register_product(product))
 
     # Retrieve offers for the registered product
-    list_offers = asyncio.run(client.get_offers(product.id))
+    list_offers = client_loop.run_until_complete(client.get_offers(product.id))
 
     for offer in list_offers:  # If there are offers, they are of offer type
         assert type(offer) == Offer
@@ -82,20 +93,23 @@ def test_get_offers_existing_product(client_type: str) -> None:
         print(offer)
 
 
-def test_get_offers_nonexistent_product(capfd, client_type: str) -> None:
+def test_get_offers_nonexistent_product(
+    capfd, authed_client: Client, client_loop: asyncio.AbstractEventLoop
+) -> None:
     """
     Attempt to retrieve offers for a non-registered product. Should trigger
     a 404 response from the API.
 
     Args:
-        client_type: Type of HTTP client.
+        authed_client: Authenticated client shared by the module.
+        client_loop: Event loop the shared client runs on.
     """
-    client = Client.load_from_file(f"dumped_clients/{client_type}_w_access_token.json")
+    client = authed_client
 
     random_id = uuid.uuid4()
 
     # Should print 404 message, but not raise an exception
-    asyncio.run(client.get_offers(random_id))
+    client_loop.run_until_complete(client.get_offers(random_id))
 
     text_output = capfd.readouterr().out
     assert f"Product ID {random_id} not registered. Response: {{'detail': 'Product does not exist'}}\n"
@@ -6,6 +6,10 @@ defined in the Offers SDK. The tests verify the correct initialization,
 string representation, and functionality of methods within these classes.
 """
 
+import dataclasses
+import os
+import pickle
+
 import pytest
 from uuid import uuid4
 from offers_sdk.models import Offer, Product
@@ -81,6 +85,24 @@ def test_product_to_dict():
     assert product.to_dict() == expected_dict
 
 
+def test_product_fields_and_pickle():
+    """
+    Test that the cached id string is not a dataclass field and survives pickling.
+    """
+    product = Product(id=uuid4(), name="Sample Product", description="Sample")
+
+    field_names = [field.name for field in dataclasses.fields(product)]
+    assert field_names == ["id", "name", "description"]
+    assert dataclasses.asdict(product) == {
+        "id": product.id,
+        "name": "Sample Product",
+        "description": "Sample",
+    }
+    restored = pickle.loads(pickle.dumps(product))
+    assert restored == product
+    assert restored.to_dict() == product.to_dict()
+
+
 def test_product_repr():
     """
     Test the string representation of the Product dataclass.
@@ -96,6 +118,58 @@ def test_product_repr():
     assert repr(product) == expected_repr
 
 
+def test_product_with_random_id():
+    """
+    Test that Product.with_random_id creates products with unique version 4 UUIDs.
+    """
+    products = [Product.with_random_id("Sample Product", "Sample") for _ in range(2000)]
+
+    assert len({product.id for product in products}) == len(products)
+    assert all(product.id.version == 4 for product in products)
+    assert products[0].name == "Sample Product"
+    assert products[0].description == "Sample"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_product_with_random_id_after_fork():
+    """
+    Test that a forked child does not reuse the parent's pooled UUIDs.
+    """
+    Product.with_random_id("Parent", "Fills the UUID pool")
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Never return into pytest from the child.
+        try:
+            os.write(write_fd, Product.with_random_id("Child", "Child").id.bytes)
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    child_id = os.read(read_fd, 16)
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+
+    assert len(child_id) == 16
+    assert child_id != Product.with_random_id("Parent", "Parent").id.bytes
+
+
+def test_models_are_immutable():
+    """
+    Test that Offer, Product and APIResponse instances cannot be modified.
+    """
+    offer = Offer(id=uuid4(), price=100, items_in_stock=5)
+    product = Product(id=uuid4(), name="Sample Product", description="Sample")
+    api_response = APIResponse(data={}, status_code=200)
+
+    with pytest.raises(AttributeError):
+        offer.price = 200
+    with pytest.raises(AttributeError):
+        product.name = "Other"
+    with pytest.raises(AttributeError):
+        api_response.status_code = 404
+
+
 # Test for the APIResponse dataclass
 def test_api_response_initialization():
     """
@@ -125,3 +199,47 @@ def test_api_response_repr():
 
     expected_repr = f"APIResponse(status_code={status_code!r}, data={response_data!r})"
     assert repr(api_response) == expected_repr
+
+
+# Test for the OfferBatch dataclass
+def test_offer_batch_from_offers():
+    """
+    Test building an OfferBatch from Offer instances.
+
+    Verifies that the columns hold the offers' values in order and support
+    NumPy aggregations.
+    """
+    np = pytest.importorskip("numpy")
+    from offers_sdk.models import OfferBatch
+
+    offers = [
+        Offer(id=uuid4(), price=1999, items_in_stock=50),
+        Offer(id=uuid4(), price=999, items_in_stock=0),
+    ]
+
+    batch = OfferBatch.from_offers(offers)
+
+    assert len(batch) == 2
+    assert list(batch.ids) == [offer.id for offer in offers]
+    assert batch.price.dtype == np.int64
+    assert batch.price.min() == 999
+    assert batch.items_in_stock.sum() == 50
+
+
+def test_offer_batch_concatenate():
+    """
+    Test joining several OfferBatch instances.
+
+    Verifies that columns are concatenated and that no batches give an empty one.
+    """
+    pytest.importorskip("numpy")
+    from offers_sdk.models import OfferBatch
+
+    first = OfferBatch.from_offers([Offer(id=uuid4(), price=1, items_in_stock=2)])
+    second = OfferBatch.from_offers([Offer(id=uuid4(), price=3, items_in_stock=4)])
+
+    joined = OfferBatch.concatenate([first, second])
+
+    assert list(joined.price) == [1, 3]
+    assert list(joined.items_in_stock) == [2, 4]
+    assert len(OfferBatch.concatenate([])) == 0
@@ -1,10 +1,12 @@
-import json
+import orjson
+import pickle
 import sys
+import uuid
 from pathlib import Path
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, Mock
 
 import pytest
-from offers_sdk.cli import main as cli_main
+from offers_sdk.cli import main as cli_main, _fast_uuid, _parse_ids, _parse_products
 from offers_sdk.models import Product
 from offers_sdk.client import Client
 
@@ -17,7 +19,7 @@ def products_file(tmp_path):
         {"id": "22222222-2222-2222-2222-222222222222", "name": "Prod B", "description": "Test B"},
     ]
     file_path = tmp_path / "products.json"
-    file_path.write_text(json.dumps(data))
+    file_path.write_bytes(orjson.dumps(data))
     return str(file_path)
 
 
@@ -29,7 +31,7 @@ def ids_file(tmp_path):
         "22222222-2222-2222-2222-222222222222",
     ]
     file_path = tmp_path / "ids.json"
-    file_path.write_text(json.dumps(data))
+    file_path.write_bytes(orjson.dumps(data))
     return str(file_path)
 
 
@@ -69,3 +71,114 @@ def test_cli_commands(cli_args, expected_calls, products_file, ids_file):
                 assert mock_client.register_product.call_count == 1
         elif "get_offers" in cli_args[2]:
             assert mock_client.get_offers.call_count == expected_calls
+
+
+def test_cli_batch_concurrency_limit(tmp_path):
+    """Test that batch commands keep at most --concurrency requests in flight."""
+    import asyncio
+
+    data = [f"{i:08d}-1111-1111-1111-111111111111" for i in range(10)]
+    file_path = tmp_path / "ids.json"
+    file_path.write_bytes(orjson.dumps(data))
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_get_offers(product_id):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return []
+
+    with patch.object(Client, "load_from_file") as mock_load:
+        mock_client = AsyncMock(spec=Client)
+        mock_client.get_offers.side_effect = fake_get_offers
+        mock_load.return_value = mock_client
+
+        args = ["--client-location", "dummy.json", "get_offers_batch",
+                "--file", str(file_path), "--concurrency", "3"]
+        with patch.object(sys, "argv", ["offers-cli"] + args):
+            cli_main()
+
+    assert mock_client.get_offers.call_count == len(data)
+    assert max_in_flight == 3
+
+
+@pytest.mark.parametrize("unsaved_changes", [True, False])
+def test_cli_saves_client_only_when_changed(unsaved_changes):
+    """Test that the client state is written back only if it changed."""
+    with patch.object(Client, "load_from_file") as mock_load:
+        mock_client = AsyncMock(spec=Client)
+        mock_client.has_unsaved_changes = unsaved_changes
+        mock_load.return_value = mock_client
+
+        args = ["--client-location", "dummy.json", "get_offers",
+                "--id", "11111111-1111-1111-1111-111111111111"]
+        with patch.object(sys, "argv", ["offers-cli"] + args):
+            cli_main()
+
+    assert mock_client.save_to_file.call_count == int(unsaved_changes)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "12345678-1234-5678-1234-567812345678",
+        "ABCDEF01-ABCD-EF01-ABCD-EF0123456789",
+        "abcdef01abcdef01abcdef0123456789",
+    ],
+)
+def test_fast_uuid_matches_uuid(value):
+    """Test that the fast path builds UUIDs equal to the ones of `uuid.UUID`."""
+    expected = uuid.UUID(value)
+    result = _fast_uuid(value)
+    assert type(result) is uuid.UUID
+    assert result == expected
+    assert hash(result) == hash(expected)
+    assert str(result) == str(expected)
+    assert result.is_safe == expected.is_safe
+    assert pickle.loads(pickle.dumps(result)) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "{12345678-1234-5678-1234-567812345678}",
+        "urn:uuid:12345678-1234-5678-1234-567812345678",
+    ],
+)
+def test_fast_uuid_fallback_forms(value):
+    """Test that braced and URN forms go through `uuid.UUID`."""
+    uuid_cls = Mock(wraps=uuid.UUID)
+    result = _fast_uuid(value, _UUID=uuid_cls)
+    uuid_cls.assert_called_once_with(value)
+    assert result == uuid.UUID(value)
+
+
+@pytest.mark.parametrize("value", ["g" * 32, "12345678-1234-5678-1234-56781234567z"])
+def test_fast_uuid_rejects_non_hex(value):
+    """Test that 32-character non-hex strings raise ValueError like `uuid.UUID`."""
+    with pytest.raises(ValueError):
+        uuid.UUID(value)
+    with pytest.raises(ValueError):
+        _fast_uuid(value)
+
+
+@pytest.mark.parametrize(
+    "parse,content",
+    [
+        (_parse_ids, b""),
+        (_parse_ids, b'["11111111-1111-1111-1111-111111111111", "2'),
+        (_parse_ids, b"{}"),
+        (_parse_products, b""),
+        (_parse_products, b'[{"id": "11111111-1111-1111-1111-111111111111", "na'),
+    ],
+)
+def test_parse_malformed_file_raises_value_error(tmp_path, parse, content):
+    """Test that empty, truncated and non-array input files raise ValueError."""
+    file_path = tmp_path / "input.json"
+    file_path.write_bytes(content)
+    with pytest.raises(ValueError):
+        list(parse(str(file_path)))
@@ -0,0 +1,104 @@
+"""
+Test Suite for the ResponseCache from the services module.
+
+These tests ensure that:
+1. Fresh responses are served from the cache and respect Cache-Control.
+2. Stale responses are revalidated with ETag and reused on 304.
+3. 404 responses are cached separately and can be invalidated.
+"""
+
+from offers_sdk.services import APIResponse, ResponseCache
+
+URL = "https://example.com/api/v1/products/1/offers"
+HEADERS = {"Bearer": "token"}
+
+
+def test_cache_hit_and_scope():
+    """
+    Test that a cached response is returned only for the same request headers.
+    """
+    cache = ResponseCache()
+    key, cached, _ = cache.lookup(URL, headers=HEADERS)
+    assert cached is None
+
+    response = APIResponse(data=[{"price": 1}], status_code=200)
+    cache.store(key, response, {"Cache-Control": "max-age=60"})
+
+    assert cache.lookup(URL, headers=HEADERS)[1] is response
+    assert cache.lookup(URL, headers={"Bearer": "other"})[1] is None
+
+
+def test_cache_no_store():
+    """
+    Test that responses with Cache-Control: no-store are not cached.
+    """
+    cache = ResponseCache()
+    key, _, _ = cache.lookup(URL, headers=HEADERS)
+    cache.store(
+        key, APIResponse(data=[], status_code=200), {"Cache-Control": "no-store"}
+    )
+    assert cache.lookup(URL, headers=HEADERS)[1] is None
+
+
+def test_cache_revalidation_with_etag():
+    """
+    Test that a stale entry sends If-None-Match and is reused on 304.
+    """
+    cache = ResponseCache()
+    key, _, _ = cache.lookup(URL, headers=HEADERS)
+    response = APIResponse(data=[{"price": 1}], status_code=200)
+    cache.store(key, response, {"Cache-Control": "no-cache", "ETag": '"v1"'})
+
+    key, cached, headers = cache.lookup(URL, headers=HEADERS)
+    assert cached is None
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["Bearer"] == "token"
+
+    not_modified = APIResponse(data={}, status_code=304)
+    assert cache.store(key, not_modified, {"Cache-Control": "max-age=60"}) is response
+    assert cache.lookup(URL, headers=HEADERS)[1] is response
+
+
+def test_cache_negative_and_invalidate():
+    """
+    Test that 404 responses are cached and dropped by invalidate().
+    """
+    cache = ResponseCache()
+    key, _, _ = cache.lookup(URL, headers=HEADERS)
+    not_found = APIResponse(data={"detail": "Product does not exist"}, status_code=404)
+    cache.store(key, not_found, {})
+    assert cache.lookup(URL, headers=HEADERS)[1] is not_found
+
+    cache.invalidate(URL)
+    assert cache.lookup(URL, headers=HEADERS)[1] is None
+
+
+def test_cache_lru_eviction():
+    """
+    Test that the least recently used entry is evicted when the cache is full.
+    """
+    cache = ResponseCache(maxsize=2)
+    for url in ("a", "b", "c"):
+        key, _, _ = cache.lookup(url)
+        cache.store(key, APIResponse(data=[], status_code=200), {})
+
+    assert cache.lookup("a")[1] is None
+    assert cache.lookup("b")[1] is not None
+    assert cache.lookup("c")[1] is not None
+
+
+def test_cache_invalidate_keeps_other_urls():
+    """
+    Test that invalidate() drops every entry of a URL and only of that URL.
+    """
+    cache = ResponseCache()
+    other = "https://example.com/api/v1/products/2/offers"
+    for url, headers in ((URL, HEADERS), (URL, {"Bearer": "other"}), (other, HEADERS)):
+        key, _, _ = cache.lookup(url, headers=headers)
+        cache.store(key, APIResponse(data=[], status_code=200), {})
+
+    cache.invalidate(URL)
+    assert cache.lookup(URL, headers=HEADERS)[1] is None
+    assert cache.lookup(URL, headers={"Bearer": "other"})[1] is None
+    assert cache.lookup(other, headers=HEADERS)[1] is not None
+    assert list(cache._keys_by_url) == [other]
@@ -0,0 +1,404 @@
+"""
+Offline tests of authentication, product registration and offer retrieval.
+
+The Client talks to an in-process fake of the Offers API, so these tests need no
+network access and mirror the live API tests of `test_02_auth_requests.py` and
+`test_03_other_requests.py`. Every test runs with each HTTP client backend: httpx
+through `httpx.MockTransport`, requests through an adapter mounted on its session
+and aiohttp against the fake API served on a local `TestServer`.
+"""
+
+import asyncio
+import contextvars
+import threading
+import uuid
+
+import httpx
+import orjson
+import pytest
+import requests
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from offers_sdk.client import Client
+from offers_sdk.exceptions import AuthException, InvalidAPIRequestException
+from offers_sdk.models import Offer, Product
+from offers_sdk.services import (
+    AioHttpClient,
+    HttpxClient,
+    RequestsClient,
+    ResponseCache,
+    aio_http_client,
+)
+
+REFRESH_TOKEN = "valid-refresh-token"
+ACCESS_TOKEN = "valid-access-token"
+
+
+class FakeOffersAPI:
+    """Minimal stand-in for the Offers API endpoints used by the SDK."""
+
+    def __init__(self) -> None:
+        self.registered = set()
+        self.authenticated = False
+        self.auth_requests = 0
+        self.offers_requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/api/v1/auth":
+            return self._auth(request)
+        if request.headers.get("Bearer") != ACCESS_TOKEN:
+            return httpx.Response(401, json={"detail": "Access token invalid"})
+        if path == "/api/v1/products/register":
+            return self._register(request)
+        return self._offers(path.split("/")[-2])
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        # Yield to the event loop like a real request, so concurrent calls interleave.
+        await asyncio.sleep(0)
+        return self(request)
+
+    def _auth(self, request: httpx.Request) -> httpx.Response:
+        self.auth_requests += 1
+        if request.headers.get("Bearer") != REFRESH_TOKEN:
+            return httpx.Response(401, json={"detail": "Bad refresh token"})
+        if self.authenticated:
+            return httpx.Response(400, json={"detail": "Cannot generate access token"})
+        self.authenticated = True
+        return httpx.Response(201, json={"access_token": ACCESS_TOKEN})
+
+    def _register(self, request: httpx.Request) -> httpx.Response:
+        product_id = orjson.loads(request.content)["id"]
+        if product_id in self.registered:
+            return httpx.Response(409, json={"detail": "Product already registered"})
+        self.registered.add(product_id)
+        return httpx.Response(201, json={"id": product_id})
+
+    def _offers(self, product_id: str) -> httpx.Response:
+        self.offers_requests += 1
+        if product_id not in self.registered:
+            return httpx.Response(404, json={"detail": "Product does not exist"})
+        offers = [
+            {"id": str(uuid.uuid4()), "price": 100 * i, "items_in_stock": i}
+            for i in range(3)
+        ]
+        return httpx.Response(200, json=offers)
+
+
+class FakeOffersAdapter(BaseAdapter):
+    """requests transport adapter answering from a FakeOffersAPI."""
+
+    def __init__(self, api: FakeOffersAPI) -> None:
+        super().__init__()
+        self.api = api
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        fake_response = self.api(
+            httpx.Request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                content=request.body,
+            )
+        )
+        response = requests.Response()
+        response.status_code = fake_response.status_code
+        response.headers = CaseInsensitiveDict(fake_response.headers)
+        response._content = fake_response.content
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+class FakeOffersServer:
+    """
+    Serves a FakeOffersAPI over HTTP on a local aiohttp `TestServer`.
+
+    The server runs on its own event loop in a background thread, as the clients
+    under test start and stop their own loops (one `asyncio.run` per call).
+    """
+
+    def __init__(self, api: FakeOffersAPI) -> None:
+        self.api = api
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", self._handle)
+        self._server = TestServer(app)
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        fake_response = await self.api.handle_async(
+            httpx.Request(
+                request.method,
+                str(request.url),
+                headers=dict(request.headers),
+                content=await request.read(),
+            )
+        )
+        return web.Response(
+            status=fake_response.status_code,
+            body=fake_response.content,
+            content_type="application/json",
+        )
+
+    def __enter__(self) -> str:
+        self._thread.start()
+        self._run(self._server.start_server())
+        return str(self._server.make_url("")).rstrip("/")
+
+    def __exit__(self, *exc_info) -> None:
+        self._run(self._server.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+
+@pytest.fixture
+def fake_api():
+    """Fake Offers API shared by the Clients of a test."""
+    return FakeOffersAPI()
+
+
+@pytest.fixture
+def fake_api_server(fake_api):
+    """Base URL of the fake API served over HTTP."""
+    with FakeOffersServer(fake_api) as base_url:
+        yield base_url
+
+
+@pytest.fixture(params=["aiohttp", "httpx", "requests"])
+def mock_client(request, fake_api):
+    """Factory of Clients of each HTTP client backend wired to one fake API."""
+    http_client_type = request.param
+    if http_client_type == "aiohttp":
+        base_url = request.getfixturevalue("fake_api_server")
+    else:
+        base_url = "https://offers.test"
+
+    def make(
+        refresh_token: str = REFRESH_TOKEN, cache: ResponseCache | None = None
+    ) -> Client:
+        client = Client(
+            refresh_token=refresh_token,
+            base_url=base_url,
+            http_client_type=http_client_type,
+            cache=cache,
+        )
+        if http_client_type == "httpx":
+            client.http_client = HttpxClient(
+                client=httpx.AsyncClient(
+                    transport=httpx.MockTransport(fake_api.handle_async)
+                ),
+                sync_client=httpx.Client(transport=httpx.MockTransport(fake_api)),
+                cache=cache,
+            )
+        elif http_client_type == "requests":
+            session = requests.Session()
+            session.mount("https://", FakeOffersAdapter(fake_api))
+            client.http_client = RequestsClient(session=session, cache=cache)
+        return client
+
+    return make
+
+
+def test_wrong_refresh_token(mock_client) -> None:
+    """
+    Test that using a wrong refresh token raises AuthException.
+    """
+    with pytest.raises(AuthException):
+        mock_client("wrong-refresh-token").retrieve_access_token()
+
+
+def test_normal(mock_client) -> None:
+    """
+    Test that a valid refresh token yields an access token.
+    """
+    client = mock_client()
+    client.retrieve_access_token()
+    assert client.access_token == ACCESS_TOKEN
+    assert client.has_unsaved_changes
+
+
+def test_normal_second(mock_client) -> None:
+    """
+    Test that a second authentication within the cooldown raises
+    InvalidAPIRequestException (HTTP 400).
+    """
+    mock_client().retrieve_access_token()
+    with pytest.raises(InvalidAPIRequestException):
+        mock_client().retrieve_access_token()
+
+
+def test_register_product_conflict(capfd, mock_client) -> None:
+    """
+    Test that registering a product twice reports the conflict without raising.
+    """
+    client = mock_client()
+    product = Product.with_random_id("Double Product", "Conflict test")
+
+    asyncio.run(client.register_product(product))
+    asyncio.run(client.register_product(product))
+
+    text_output = capfd.readouterr().out
+    assert f"Product {product} registered successfully.\n" in text_output
+    assert f"Product {product} already registered.\n" in text_output
+
+
+def test_get_offers_existing_product(mock_client) -> None:
+    """
+    Test that offers of a registered product are returned as Offer instances.
+    """
+    client = mock_client()
+    product = Product.with_random_id("Product With Offers", "Testing get_offers")
+
+    async def register_and_get():
+        await client.register_product(product)
+        return await client.get_offers(product.id)
+
+    list_offers = asyncio.run(register_and_get())
+
+    assert len(list_offers) == 3
+    assert all(type(offer) == Offer for offer in list_offers)
+
+
+def test_get_offers_nonexistent_product(capfd, mock_client) -> None:
+    """
+    Test that offers of an unknown product print the 404 message and return [].
+    """
+    client = mock_client()
+    random_id = uuid.uuid4()
+
+    assert asyncio.run(client.get_offers(random_id)) == []
+
+    text_output = capfd.readouterr().out
+    assert (
+        f"Product ID {random_id} not registered. "
+        f"Response: {{'detail': 'Product does not exist'}}\n" in text_output
+    )
+
+
+def test_get_offers_array(capfd, fake_api, mock_client) -> None:
+    """
+    Test that offers are returned as OfferBatch columns, and that an unknown
+    product yields an empty batch.
+    """
+    np = pytest.importorskip("numpy")
+    client = mock_client()
+    product_id = uuid.uuid4()
+    fake_api.registered.add(str(product_id))
+
+    batch = asyncio.run(client.get_offers_array(product_id))
+
+    assert len(batch) == 3
+    assert batch.price.dtype == np.int64
+    assert batch.price.tolist() == [0, 100, 200]
+    assert batch.items_in_stock.tolist() == [0, 1, 2]
+
+    random_id = uuid.uuid4()
+    empty = asyncio.run(client.get_offers_array(random_id))
+
+    assert len(empty) == 0
+    assert empty.price.dtype == np.int64
+    assert f"Product ID {random_id} not registered." in capfd.readouterr().out
+
+
+def test_concurrent_get_offers_authenticate_once(fake_api, mock_client) -> None:
+    """
+    Test that concurrent requests of a client without an access token share a
+    single authentication request.
+    """
+    client = mock_client()
+    product_id = uuid.uuid4()
+    fake_api.registered.add(str(product_id))
+
+    async def get_many():
+        return await asyncio.gather(*(client.get_offers(product_id) for _ in range(50)))
+
+    results = asyncio.run(get_many())
+
+    assert fake_api.auth_requests == 1
+    assert all(len(list_offers) == 3 for list_offers in results)
+
+
+def test_get_offers_cached(fake_api, mock_client) -> None:
+    """
+    Test that a client given a ResponseCache serves repeated `get_offers` calls
+    from it until `clear_cache()`.
+    """
+    client = mock_client(cache=ResponseCache())
+    product_id = uuid.uuid4()
+    fake_api.registered.add(str(product_id))
+
+    first = asyncio.run(client.get_offers(product_id))
+    assert asyncio.run(client.get_offers(product_id)) == first
+    assert fake_api.offers_requests == 1
+
+    client.clear_cache()
+    assert asyncio.run(client.get_offers(product_id)) != first
+    assert fake_api.offers_requests == 2
+
+
+def test_aiohttp_session_pooled_only_inside_context() -> None:
+    """
+    Test that AioHttpClient keeps a pooled session only inside `async with`, so
+    one `asyncio.run` per call does not leave sessions of closed loops behind.
+    """
+    http_client = AioHttpClient(cache=None)
+    # Nothing listens on the port; only the session handling matters here.
+    url = "http://127.0.0.1:9/"
+
+    asyncio.run(http_client.async_get(url))
+    assert http_client._session is None
+
+    async def within_context():
+        async with http_client:
+            await http_client.async_get(url)
+            return http_client._session
+
+    session = asyncio.run(within_context())
+    assert session is not None and session.closed
+    assert http_client._session is None
+
+
+def test_aiohttp_sync_post_shares_one_loop() -> None:
+    """
+    Test that `sync_post` of all AioHttpClients runs on one shared event loop, so
+    clients that are never closed do not leave event loops behind.
+    """
+    url = "http://127.0.0.1:9/"
+    AioHttpClient(cache=None).sync_post(url)
+    loop = aio_http_client._sync_loop
+    AioHttpClient(cache=None).sync_post(url)
+
+    assert loop is not None and not loop.is_closed()
+    assert aio_http_client._sync_loop is loop
+
+
+def test_requests_client_runs_in_caller_context() -> None:
+    """
+    Test that RequestsClient runs requests in its worker threads with the context
+    variables of the calling coroutine.
+    """
+    request_id = contextvars.ContextVar("request_id")
+    http_client = RequestsClient(session=requests.Session(), cache=None)
+
+    async def run(func):
+        return await http_client._run_in_executor(func)
+
+    assert asyncio.run(run(lambda: request_id.get(None))) is None
+
+    async def with_request_id():
+        request_id.set("abc")
+        return await run(request_id.get)
+
+    assert asyncio.run(with_request_id()) == "abc"
+    asyncio.run(http_client.aclose())